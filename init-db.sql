@@ -1,158 +1,71 @@
--- Oscilloscope Analysis Database Schema
--- This will run automatically when PostgreSQL starts
-
--- DTT Analysis Table
-CREATE TABLE IF NOT EXISTS dtt_analysis (
-    id SERIAL PRIMARY KEY,
-    file_name VARCHAR(255) NOT NULL,
-    test_number VARCHAR(50) NOT NULL,
-    test_bench VARCHAR(100) NOT NULL,
-    tester_id VARCHAR(50) NOT NULL,
-    test_date DATE NOT NULL,
-    analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    dut_device VARCHAR(255),
-    reference_device VARCHAR(255),
-    test_function VARCHAR(100),
-    peak_to_peak_mv DECIMAL(10,3),
-    trigger_current_a DECIMAL(10,3),
-    noise_mv DECIMAL(10,3),
-    frequency_khz DECIMAL(10,3),
-    data_points INTEGER,
-    sample_rate_khz DECIMAL(10,3),
-    peak_to_peak_lsl DECIMAL(10,3),
-    peak_to_peak_usl DECIMAL(10,3),
-    trigger_current_lsl DECIMAL(10,3),
-    trigger_current_usl DECIMAL(10,3),
-    noise_lsl DECIMAL(10,3),
-    noise_usl DECIMAL(10,3),
-    trigger_events INTEGER,
-    pass_fail VARCHAR(10)
-);
-
--- DC02 Analysis Table (includes ringdown)
-CREATE TABLE IF NOT EXISTS dc02_analysis (
-    id SERIAL PRIMARY KEY,
-    file_name VARCHAR(255) NOT NULL,
-    test_number VARCHAR(50) NOT NULL,
-    test_bench VARCHAR(100) NOT NULL,
-    tester_id VARCHAR(50) NOT NULL,
-    test_date DATE NOT NULL,
-    analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    dut_device VARCHAR(255),
-    reference_device VARCHAR(255),
-    test_function VARCHAR(100),
-    peak_to_peak_mv DECIMAL(10,3),
-    trigger_current_a DECIMAL(10,3),
-    noise_mv DECIMAL(10,3),
-    ringdown_voltage_mv DECIMAL(10,3),
-    frequency_khz DECIMAL(10,3),
-    data_points INTEGER,
-    sample_rate_khz DECIMAL(10,3),
-    peak_to_peak_lsl DECIMAL(10,3),
-    peak_to_peak_usl DECIMAL(10,3),
-    trigger_current_lsl DECIMAL(10,3),
-    trigger_current_usl DECIMAL(10,3),
-    noise_lsl DECIMAL(10,3),
-    noise_usl DECIMAL(10,3),
-    ringdown_lsl DECIMAL(10,3),
-    ringdown_usl DECIMAL(10,3),
-    trigger_events INTEGER,
-    pass_fail VARCHAR(10)
-);
-
--- DTR Analysis Table
-CREATE TABLE IF NOT EXISTS dtr_analysis (
-    id SERIAL PRIMARY KEY,
-    file_name VARCHAR(255) NOT NULL,
-    test_number VARCHAR(50) NOT NULL,
-    test_bench VARCHAR(100) NOT NULL,
-    tester_id VARCHAR(50) NOT NULL,
-    test_date DATE NOT NULL,
-    analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    dut_device VARCHAR(255),
-    reference_device VARCHAR(255),
-    test_function VARCHAR(100),
-    peak_to_peak_mv DECIMAL(10,3),
-    trigger_current_a DECIMAL(10,3),
-    noise_mv DECIMAL(10,3),
-    frequency_khz DECIMAL(10,3),
-    data_points INTEGER,
-    sample_rate_khz DECIMAL(10,3),
-    peak_to_peak_lsl DECIMAL(10,3),
-    peak_to_peak_usl DECIMAL(10,3),
-    trigger_current_lsl DECIMAL(10,3),
-    trigger_current_usl DECIMAL(10,3),
-    noise_lsl DECIMAL(10,3),
-    noise_usl_spin DECIMAL(10,3),
-    trigger_events INTEGER,
-    pass_fail VARCHAR(10)
-);
-
--- DC03 Skid Analysis Table
-CREATE TABLE IF NOT EXISTS dc03_skid_analysis (
-    id SERIAL PRIMARY KEY,
-    file_name VARCHAR(255) NOT NULL,
-    test_number VARCHAR(50) NOT NULL,
-    test_bench VARCHAR(100) NOT NULL,
-    tester_id VARCHAR(50) NOT NULL,
-    test_date DATE NOT NULL,
-    analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    dut_device VARCHAR(255),
-    reference_device VARCHAR(255),
-    test_function VARCHAR(100),
-    peak_to_peak_mv DECIMAL(10,3),
-    trigger_current_a DECIMAL(10,3),
-    noise_mv DECIMAL(10,3),
-    frequency_khz DECIMAL(10,3),
-    data_points INTEGER,
-    sample_rate_khz DECIMAL(10,3),
-    peak_to_peak_lsl DECIMAL(10,3),
-    peak_to_peak_usl DECIMAL(10,3),
-    trigger_current_lsl DECIMAL(10,3),
-    trigger_current_usl DECIMAL(10,3),
-    noise_lsl DECIMAL(10,3),
-    noise_usl DECIMAL(10,3),
-    trigger_events INTEGER,
-    pass_fail VARCHAR(10)
-);
-
--- IDOD Analysis Table (includes skid plate diameter)
-CREATE TABLE IF NOT EXISTS idod_analysis (
-    id SERIAL PRIMARY KEY,
-    file_name VARCHAR(255) NOT NULL,
-    test_number VARCHAR(50) NOT NULL,
-    test_bench VARCHAR(100) NOT NULL,
-    tester_id VARCHAR(50) NOT NULL,
-    test_date DATE NOT NULL,
-    analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    dut_device VARCHAR(255),
-    reference_device VARCHAR(255),
-    skid_plate_diameter VARCHAR(50),
-    test_function VARCHAR(100),
-    peak_to_peak_mv DECIMAL(10,3),
-    trigger_current_a DECIMAL(10,3),
-    noise_mv DECIMAL(10,3),
-    frequency_khz DECIMAL(10,3),
-    data_points INTEGER,
-    sample_rate_khz DECIMAL(10,3),
-    peak_to_peak_lsl DECIMAL(10,3),
-    peak_to_peak_usl DECIMAL(10,3),
-    trigger_current_lsl DECIMAL(10,3),
-    trigger_current_usl DECIMAL(10,3),
-    noise_lsl DECIMAL(10,3),
-    noise_usl DECIMAL(10,3),
-    trigger_events INTEGER,
-    pass_fail VARCHAR(10)
-);
-
--- Insert sample data for testing
-INSERT INTO dtt_analysis (
-    file_name, test_number, test_bench, tester_id, test_date, test_function,
-    dut_device, reference_device, peak_to_peak_mv, trigger_current_a, noise_mv,
-    frequency_khz, data_points, sample_rate_khz, peak_to_peak_lsl, peak_to_peak_usl,
-    trigger_current_lsl, trigger_current_usl, noise_lsl, noise_usl, trigger_events, pass_fail
-) VALUES (
-    'sample_test.csv', 'T001', 'Bench A', 'admin', CURRENT_DATE, 'Performance test',
-    'DTT (SV/33053/0020) [DUT]', 'DTR (SV/33053/0031) [Reference]', 350.5, 55.2, 2.1,
-    250.0, 2000, 250.0, 150, 400, 30, 80, 0, 5, 3, 'pass'
-);
+-- Oscilloscope Analysis Database Schema
+-- This will run automatically when PostgreSQL starts
+
+-- One partitioned table replaces the five near-identical per-test-type
+-- tables; the partitions keep the old table names so existing queries
+-- (and direct partition scans) continue to work, while indexes and new
+-- columns are defined once on the parent.
+CREATE TABLE IF NOT EXISTS analysis_results (
+    id SERIAL,
+    test_type TEXT NOT NULL,
+    file_name VARCHAR(255) NOT NULL,
+    test_number VARCHAR(50) NOT NULL,
+    test_bench VARCHAR(100) NOT NULL,
+    tester_id VARCHAR(50) NOT NULL,
+    test_date DATE NOT NULL,
+    analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    dut_device VARCHAR(255),
+    reference_device VARCHAR(255),
+    skid_plate_diameter VARCHAR(50),
+    test_function VARCHAR(100),
+    peak_to_peak_mv DOUBLE PRECISION,
+    trigger_current_a DOUBLE PRECISION,
+    noise_mv DOUBLE PRECISION,
+    ringdown_voltage_mv DOUBLE PRECISION,
+    frequency_khz DOUBLE PRECISION,
+    data_points INTEGER,
+    sample_rate_khz DOUBLE PRECISION,
+    peak_to_peak_lsl DOUBLE PRECISION,
+    peak_to_peak_usl DOUBLE PRECISION,
+    trigger_current_lsl DOUBLE PRECISION,
+    trigger_current_usl DOUBLE PRECISION,
+    noise_lsl DOUBLE PRECISION,
+    noise_usl DOUBLE PRECISION,
+    ringdown_lsl DOUBLE PRECISION,
+    ringdown_usl DOUBLE PRECISION,
+    trigger_events INTEGER,
+    pass_fail VARCHAR(10),
+    PRIMARY KEY (id, test_type)
+) PARTITION BY LIST (test_type);
+
+CREATE TABLE IF NOT EXISTS dtt_analysis PARTITION OF analysis_results FOR VALUES IN ('DTT');
+CREATE TABLE IF NOT EXISTS dtr_analysis PARTITION OF analysis_results FOR VALUES IN ('DTR');
+CREATE TABLE IF NOT EXISTS dc02_analysis PARTITION OF analysis_results FOR VALUES IN ('DC02');
+CREATE TABLE IF NOT EXISTS dc03_skid_analysis PARTITION OF analysis_results FOR VALUES IN ('DC03 SKID');
+CREATE TABLE IF NOT EXISTS idod_analysis PARTITION OF analysis_results FOR VALUES IN ('IDOD');
+
+-- Indexes declared once on the parent propagate to every partition
+CREATE INDEX IF NOT EXISTS idx_analysis_results_test_date ON analysis_results(test_date);
+CREATE INDEX IF NOT EXISTS idx_analysis_results_passfail_date ON analysis_results(pass_fail, test_date DESC);
+CREATE INDEX IF NOT EXISTS idx_analysis_results_tester ON analysis_results(tester_id);
+CREATE INDEX IF NOT EXISTS idx_analysis_results_test_number ON analysis_results(test_number);
+CREATE INDEX IF NOT EXISTS idx_analysis_results_bench ON analysis_results(test_bench);
+CREATE INDEX IF NOT EXISTS idx_analysis_results_failures ON analysis_results(test_date DESC) WHERE pass_fail = 'fail';
+
+-- Trigram GIN indexes let the tester/bench substring filters (ILIKE '%...%')
+-- use an index instead of scanning every partition
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_analysis_results_tester_trgm ON analysis_results USING gin (tester_id gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_analysis_results_bench_trgm ON analysis_results USING gin (test_bench gin_trgm_ops);
+
+-- Insert sample data for testing
+INSERT INTO analysis_results (
+    test_type, file_name, test_number, test_bench, tester_id, test_date, test_function,
+    dut_device, reference_device, peak_to_peak_mv, trigger_current_a, noise_mv,
+    frequency_khz, data_points, sample_rate_khz, peak_to_peak_lsl, peak_to_peak_usl,
+    trigger_current_lsl, trigger_current_usl, noise_lsl, noise_usl, trigger_events, pass_fail
+) VALUES (
+    'DTT', 'sample_test.csv', 'T001', 'Bench A', 'admin', CURRENT_DATE, 'Performance test',
+    'DTT (SV/33053/0020) [DUT]', 'DTR (SV/33053/0031) [Reference]', 350.5, 55.2, 2.1,
+    250.0, 2000, 250.0, 150, 400, 30, 80, 0, 5, 3, 'pass'
+);
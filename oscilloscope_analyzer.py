@@ -1,1677 +1,2450 @@
-# oscilloscope_analyzer.py
-import sys
-import os
-import csv
-import numpy as np
-import pandas as pd
-import matplotlib
-matplotlib.use("QtAgg")
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import psycopg2
-from datetime import datetime, timedelta
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QGridLayout, QLabel, QLineEdit, QPushButton,
-                             QComboBox, QSpinBox, QDoubleSpinBox, QTextEdit, QTabWidget,
-                             QTableWidget, QTableWidgetItem, QFileDialog, QMessageBox,
-                             QGroupBox, QFormLayout, QCheckBox, QProgressBar, QSplitter,
-                             QScrollArea, QFrame, QDateEdit, QHeaderView)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QDate
-from PyQt6.QtGui import QFont, QPalette, QColor, QIcon
-
-class DatabaseManager:
-    def __init__(self):
-        self.connection_params = {
-            'host': 'localhost',
-            'database': 'oscilloscope_db',
-            'user': 'oscuser',
-            'password': 'oscpassword123',
-            'port': '5432'
-        }
-        
-    def connect(self):
-        try:
-            return psycopg2.connect(**self.connection_params)
-        except Exception as e:
-            print(f"Database connection error: {e}")
-            return None
-    
-    def save_analysis(self, test_type, data):
-        conn = self.connect()
-        if not conn:
-            return False
-            
-        try:
-            cursor = conn.cursor()
-            table_name = f"{test_type.lower().replace(' ', '_')}_analysis"
-            
-            columns = list(data.keys())
-            values = list(data.values())
-            placeholders = ', '.join(['%s'] * len(values))
-            
-            query = f"""
-            INSERT INTO {table_name} ({', '.join(columns)}) 
-            VALUES ({placeholders})
-            """
-            
-            cursor.execute(query, values)
-            conn.commit()
-            return True
-            
-        except Exception as e:
-            print(f"Database save error: {e}")
-            return False
-        finally:
-            conn.close()
-    
-    def get_results(self, test_type, limit=100):
-        conn = self.connect()
-        if not conn:
-            return []
-            
-        try:
-            cursor = conn.cursor()
-            table_name = f"{test_type.lower().replace(' ', '_')}_analysis"
-            
-            cursor.execute(f"""
-                SELECT * FROM {table_name} 
-                ORDER BY analysis_date DESC 
-                LIMIT %s
-            """, (limit,))
-            
-            columns = [desc[0] for desc in cursor.description]
-            results = cursor.fetchall()
-            
-            return [dict(zip(columns, row)) for row in results]
-            
-        except Exception as e:
-            print(f"Database query error: {e}")
-            return []
-        finally:
-            conn.close()
-    
-    def get_all_results(self, filters=None):
-        """Get results from all tables with optional filters"""
-        conn = self.connect()
-        if not conn:
-            return []
-            
-        all_results = []
-        tables = ['dtt_analysis', 'dtr_analysis', 'dc02_analysis', 'dc03_skid_analysis', 'idod_analysis']
-        
-        try:
-            cursor = conn.cursor()
-            
-            for table in tables:
-                # Check if table exists
-                cursor.execute("""
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables 
-                        WHERE table_name = %s
-                    );
-                """, (table,))
-                
-                if not cursor.fetchone()[0]:
-                    continue
-                
-                # Build query with filters
-                query = f"SELECT *, '{table}' as source_table FROM {table}"
-                where_conditions = []
-                params = []
-                
-                if filters:
-                    if filters.get('test_type') and filters['test_type'] != 'All':
-                        table_test_type = table.replace('_analysis', '').upper().replace('_', ' ')
-                        if table_test_type != filters['test_type'].upper():
-                            continue
-                    
-                    if filters.get('pass_fail') and filters['pass_fail'] != 'All':
-                        where_conditions.append("pass_fail = %s")
-                        params.append(filters['pass_fail'].lower())
-                    
-                    if filters.get('tester_id'):
-                        where_conditions.append("tester_id ILIKE %s")
-                        params.append(f"%{filters['tester_id']}%")
-                    
-                    if filters.get('test_bench'):
-                        where_conditions.append("test_bench ILIKE %s")
-                        params.append(f"%{filters['test_bench']}%")
-                    
-                    if filters.get('date_from'):
-                        where_conditions.append("test_date >= %s")
-                        params.append(filters['date_from'])
-                    
-                    if filters.get('date_to'):
-                        where_conditions.append("test_date <= %s")
-                        params.append(filters['date_to'])
-                
-                if where_conditions:
-                    query += " WHERE " + " AND ".join(where_conditions)
-                
-                query += " ORDER BY analysis_date DESC"
-                
-                cursor.execute(query, params)
-                columns = [desc[0] for desc in cursor.description]
-                results = cursor.fetchall()
-                
-                for row in results:
-                    result_dict = dict(zip(columns, row))
-                    result_dict['test_type'] = table.replace('_analysis', '').upper().replace('_', ' ')
-                    all_results.append(result_dict)
-            
-            return all_results
-            
-        except Exception as e:
-            print(f"Database query error: {e}")
-            return []
-        finally:
-            conn.close()
-    
-    def get_analytics_summary(self, filters=None):
-        """Get summary statistics for analytics"""
-        results = self.get_all_results(filters)
-        
-        if not results:
-            return {}
-        
-        # Basic counts
-        total_tests = len(results)
-        pass_count = len([r for r in results if r.get('pass_fail') == 'pass'])
-        fail_count = total_tests - pass_count
-        pass_rate = (pass_count / total_tests * 100) if total_tests > 0 else 0
-        
-        # Test type breakdown
-        test_types = {}
-        for result in results:
-            test_type = result.get('test_type', 'Unknown')
-            if test_type not in test_types:
-                test_types[test_type] = {'total': 0, 'pass': 0, 'fail': 0}
-            test_types[test_type]['total'] += 1
-            if result.get('pass_fail') == 'pass':
-                test_types[test_type]['pass'] += 1
-            else:
-                test_types[test_type]['fail'] += 1
-        
-        # Tester performance
-        testers = {}
-        for result in results:
-            tester = result.get('tester_id', 'Unknown')
-            if tester not in testers:
-                testers[tester] = {'total': 0, 'pass': 0, 'fail': 0}
-            testers[tester]['total'] += 1
-            if result.get('pass_fail') == 'pass':
-                testers[tester]['pass'] += 1
-            else:
-                testers[tester]['fail'] += 1
-        
-        # Test bench performance
-        test_benches = {}
-        for result in results:
-            bench = result.get('test_bench', 'Unknown')
-            if bench not in test_benches:
-                test_benches[bench] = {'total': 0, 'pass': 0, 'fail': 0}
-            test_benches[bench]['total'] += 1
-            if result.get('pass_fail') == 'pass':
-                test_benches[bench]['pass'] += 1
-            else:
-                test_benches[bench]['fail'] += 1
-        
-        # Recent trends (last 30 days)
-        recent_date = datetime.now().date() - timedelta(days=30)
-        recent_results = [r for r in results if r.get('test_date') and r['test_date'] >= recent_date]
-        recent_pass_rate = (len([r for r in recent_results if r.get('pass_fail') == 'pass']) / len(recent_results) * 100) if recent_results else 0
-        
-        # Parameter statistics
-        peak_to_peak_values = [float(r.get('peak_to_peak_mv', 0)) for r in results if r.get('peak_to_peak_mv')]
-        trigger_current_values = [float(r.get('trigger_current_a', 0)) for r in results if r.get('trigger_current_a')]
-        noise_values = [float(r.get('noise_mv', 0)) for r in results if r.get('noise_mv')]
-        
-        return {
-            'summary': {
-                'total_tests': total_tests,
-                'pass_count': pass_count,
-                'fail_count': fail_count,
-                'pass_rate': pass_rate,
-                'recent_pass_rate': recent_pass_rate,
-                'recent_tests': len(recent_results)
-            },
-            'test_types': test_types,
-            'testers': testers,
-            'test_benches': test_benches,
-            'parameters': {
-                'peak_to_peak': {
-                    'mean': np.mean(peak_to_peak_values) if peak_to_peak_values else 0,
-                    'std': np.std(peak_to_peak_values) if peak_to_peak_values else 0,
-                    'min': min(peak_to_peak_values) if peak_to_peak_values else 0,
-                    'max': max(peak_to_peak_values) if peak_to_peak_values else 0
-                },
-                'trigger_current': {
-                    'mean': np.mean(trigger_current_values) if trigger_current_values else 0,
-                    'std': np.std(trigger_current_values) if trigger_current_values else 0,
-                    'min': min(trigger_current_values) if trigger_current_values else 0,
-                    'max': max(trigger_current_values) if trigger_current_values else 0
-                },
-                'noise': {
-                    'mean': np.mean(noise_values) if noise_values else 0,
-                    'std': np.std(noise_values) if noise_values else 0,
-                    'min': min(noise_values) if noise_values else 0,
-                    'max': max(noise_values) if noise_values else 0
-                }
-            }
-        }
-
-class AnalysisWorker(QThread):
-    finished = pyqtSignal(dict)
-    progress = pyqtSignal(int)
-    
-    def __init__(self, file_path, trigger_current):
-        super().__init__()
-        self.file_path = file_path
-        self.trigger_current = trigger_current
-        
-    def run(self):
-        try:
-            self.progress.emit(10)
-            data = self.load_csv_data(self.file_path)
-            
-            self.progress.emit(30)
-            analysis = self.calculate_analysis(data, self.trigger_current)
-            
-            self.progress.emit(100)
-            self.finished.emit(analysis)
-            
-        except Exception as e:
-            print(f"Analysis error: {e}")
-            self.finished.emit({})
-    
-    def load_csv_data(self, file_path):
-        with open(file_path, 'r') as file:
-            lines = file.readlines()
-        
-        data_start = -1
-        for i, line in enumerate(lines):
-            if 'TIME,CH1,CH2' in line:
-                data_start = i
-                break
-        
-        if data_start == -1:
-            raise ValueError("Could not find data header in CSV file")
-        
-        data = []
-        for line in lines[data_start + 1:]:
-            line = line.strip()
-            if line:
-                parts = line.split(',')
-                if len(parts) >= 3:
-                    try:
-                        time = float(parts[0]) * 1000
-                        ch1 = float(parts[1])
-                        ch2 = float(parts[2])
-                        data.append({'time': time, 'ch1': ch1, 'ch2': ch2})
-                    except ValueError:
-                        continue
-        
-        return data
-    
-    def calculate_analysis(self, data, trigger_threshold):
-        if not data:
-            return {}
-        
-        times = [d['time'] for d in data]
-        ch1_values = [d['ch1'] for d in data]
-        ch2_values = [d['ch2'] for d in data]
-        
-        ch1_min, ch1_max = min(ch1_values), max(ch1_values)
-        ch1_peak_to_peak = (ch1_max - ch1_min) * 1000
-        
-        ch2_min, ch2_max = min(ch2_values), max(ch2_values)
-        ch2_peak_to_peak = ch2_max - ch2_min
-        
-        ch1_rms = np.sqrt(np.mean([v**2 for v in ch1_values]))
-        ch2_rms = np.sqrt(np.mean([v**2 for v in ch2_values]))
-        
-        ch1_mean = np.mean(ch1_values)
-        ch1_noise = np.std(ch1_values) * 1000
-        
-        trigger_points = []
-        in_trigger = False
-        
-        for i in range(1, len(data)):
-            prev_current = abs(data[i-1]['ch2'])
-            current_current = abs(data[i]['ch2'])
-            
-            if not in_trigger and current_current > trigger_threshold and prev_current <= trigger_threshold:
-                trigger_points.append({
-                    'time': data[i]['time'],
-                    'index': i,
-                    'current': data[i]['ch2']
-                })
-                in_trigger = True
-            elif in_trigger and current_current <= trigger_threshold:
-                in_trigger = False
-        
-        ringdown = self.calculate_ringdown(ch1_values)
-        
-        if len(times) > 1:
-            duration = max(times) - min(times)
-            sample_rate = len(times) / (duration / 1000) if duration > 0 else 0
-        else:
-            sample_rate = 0
-        
-        return {
-            'raw_data': data,
-            'ch1': {
-                'min': ch1_min,
-                'max': ch1_max,
-                'peak_to_peak': ch1_peak_to_peak,
-                'rms': ch1_rms,
-                'noise': ch1_noise,
-                'ringdown': ringdown
-            },
-            'ch2': {
-                'min': ch2_min,
-                'max': ch2_max,
-                'peak_to_peak': ch2_peak_to_peak,
-                'rms': ch2_rms
-            },
-            'trigger': {
-                'threshold': trigger_threshold,
-                'points': trigger_points,
-                'count': len(trigger_points)
-            },
-            'metadata': {
-                'data_points': len(data),
-                'sample_rate': sample_rate,
-                'duration': max(times) - min(times) if times else 0,
-                'time_start': min(times) if times else 0,
-                'time_end': max(times) if times else 0
-            }
-        }
-    
-    def calculate_ringdown(self, values):
-        if len(values) < 50:
-            return {'ringdown_voltage': 0, 'decay_constant': 0}
-        
-        abs_values = [abs(v) for v in values]
-        max_idx = abs_values.index(max(abs_values))
-        
-        if max_idx >= len(values) - 20:
-            return {'ringdown_voltage': 0, 'decay_constant': 0}
-        
-        decay_segment = values[max_idx:min(max_idx + 100, len(values))]
-        initial_amp = abs(decay_segment[0])
-        final_amp = abs(decay_segment[-1])
-        
-        ringdown_voltage = (initial_amp - final_amp) * 1000
-        
-        return {
-            'ringdown_voltage': ringdown_voltage,
-            'decay_constant': np.log(initial_amp / final_amp) / len(decay_segment) if initial_amp > final_amp > 0 else 0
-        }
-
-class MatplotlibWidget(QWidget):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.figure = Figure(figsize=(10, 6))
-        self.canvas = FigureCanvas(self.figure)
-        
-        layout = QVBoxLayout()
-        layout.addWidget(self.canvas)
-        self.setLayout(layout)
-        
-    def plot_data(self, analysis_data, trigger_current, zoom_range=(0, 100)):
-        self.figure.clear()
-        
-        if not analysis_data or 'raw_data' not in analysis_data:
-            self.canvas.draw()
-            return
-        
-        data = analysis_data['raw_data']
-        if not data:
-            self.canvas.draw()
-            return
-        
-        times = [d['time'] for d in data]
-        ch1_values = [d['ch1'] for d in data]
-        ch2_values = [d['ch2'] for d in data]
-        
-        start_idx = int(len(data) * zoom_range[0] / 100)
-        end_idx = int(len(data) * zoom_range[1] / 100)
-        
-        plot_times = times[start_idx:end_idx]
-        plot_ch1 = ch1_values[start_idx:end_idx]
-        plot_ch2 = ch2_values[start_idx:end_idx]
-        
-        ax1 = self.figure.add_subplot(211)
-        ax2 = self.figure.add_subplot(212)
-        
-        ax1.plot(plot_times, plot_ch1, 'g-', linewidth=1, label='CH1 (Voltage)')
-        ax1.set_ylabel('Voltage (V)')
-        ax1.set_title('Channel 1 - Voltage')
-        ax1.grid(True, alpha=0.3)
-        ax1.legend()
-        
-        ax2.plot(plot_times, plot_ch2, 'b-', linewidth=1, label='CH2 (Current)')
-        ax2.axhline(y=trigger_current, color='r', linestyle='--', alpha=0.7, label=f'Trigger +{trigger_current}A')
-        ax2.axhline(y=-trigger_current, color='r', linestyle='--', alpha=0.7, label=f'Trigger -{trigger_current}A')
-        ax2.set_xlabel('Time (ms)')
-        ax2.set_ylabel('Current (A)')
-        ax2.set_title('Channel 2 - Current')
-        ax2.grid(True, alpha=0.3)
-        ax2.legend()
-        
-        trigger_points = analysis_data.get('trigger', {}).get('points', [])
-        for point in trigger_points:
-            if start_idx <= point['index'] < end_idx:
-                ax2.axvline(x=point['time'], color='orange', linestyle=':', alpha=0.8)
-        
-        self.figure.tight_layout()
-        self.canvas.draw()
-    
-    def plot_analytics_charts(self, summary_data):
-        self.figure.clear()
-        
-        if not summary_data:
-            self.canvas.draw()
-            return
-        
-        ax1 = self.figure.add_subplot(221)
-        ax2 = self.figure.add_subplot(222)
-        ax3 = self.figure.add_subplot(223)
-        ax4 = self.figure.add_subplot(224)
-        
-        summary = summary_data.get('summary', {})
-        if summary.get('total_tests', 0) > 0:
-            labels = ['Pass', 'Fail']
-            sizes = [summary.get('pass_count', 0), summary.get('fail_count', 0)]
-            colors = ['#4CAF50', '#F44336']
-            ax1.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
-            ax1.set_title(f'Overall Results\n({summary.get("total_tests", 0)} tests)')
-        
-        test_types = summary_data.get('test_types', {})
-        if test_types:
-            types = list(test_types.keys())
-            pass_rates = [test_types[t]['pass'] / test_types[t]['total'] * 100 if test_types[t]['total'] > 0 else 0 for t in types]
-            
-            bars = ax2.bar(types, pass_rates, color='#2196F3', alpha=0.7)
-            ax2.set_title('Pass Rate by Test Type')
-            ax2.set_ylabel('Pass Rate (%)')
-            ax2.set_ylim(0, 100)
-            
-            for bar, rate in zip(bars, pass_rates):
-                ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
-                        f'{rate:.1f}%', ha='center', va='bottom')
-        
-        parameters = summary_data.get('parameters', {})
-        peak_to_peak = parameters.get('peak_to_peak', {})
-        if peak_to_peak.get('mean', 0) > 0 and peak_to_peak.get('std', 0) > 0:
-            mean = peak_to_peak['mean']
-            std = peak_to_peak['std']
-            x = np.linspace(max(0, mean - 3*std), mean + 3*std, 100)
-            y = (1/(std * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x - mean) / std) ** 2)
-            ax3.plot(x, y, 'g-', linewidth=2)
-            ax3.axvline(mean, color='r', linestyle='--', alpha=0.7, label=f'Mean: {mean:.1f}mV')
-            ax3.set_title('Peak-to-Peak Distribution')
-            ax3.set_xlabel('Peak-to-Peak (mV)')
-            ax3.set_ylabel('Probability Density')
-            ax3.legend()
-        
-        testers = summary_data.get('testers', {})
-        if testers:
-            tester_names = list(testers.keys())
-            tester_pass_rates = [testers[t]['pass'] / testers[t]['total'] * 100 if testers[t]['total'] > 0 else 0 for t in tester_names]
-            
-            bars = ax4.barh(tester_names, tester_pass_rates, color='#FF9800', alpha=0.7)
-            ax4.set_title('Pass Rate by Tester')
-            ax4.set_xlabel('Pass Rate (%)')
-            ax4.set_xlim(0, 100)
-            
-            for bar, rate in zip(bars, tester_pass_rates):
-                ax4.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2,
-                        f'{rate:.1f}%', ha='left', va='center')
-        
-        self.figure.tight_layout()
-        self.canvas.draw()
-
-class OscilloscopeAnalyzer(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Oscilloscope Test System - PyQt6")
-        self.setGeometry(100, 100, 1400, 1000)
-        
-        self.db_manager = DatabaseManager()
-        self.current_analysis = None
-        self.loaded_files = []
-        
-        self.test_type_configs = {
-            'DTT': {
-                'name': 'DTT',
-                'dut_label': 'DTT (SV/33053/0020) [DUT]',
-                'reference_label': 'DTR (SV/33053/0031) [Reference]',
-                'has_ringdown': False
-            },
-            'DTR': {
-                'name': 'DTR',
-                'dut_label': 'DTR (SV/33053/0031) [DUT]',
-                'reference_label': 'DTT (SV/33053/0020) [Reference]',
-                'has_ringdown': False
-            },
-            'DC02': {
-                'name': 'DC02',
-                'dut_label': 'DC02 Innerblock (SV/103003/0016) [DUT]',
-                'reference_label': 'DCbox (SV/102603/0033) [Reference]',
-                'has_ringdown': True
-            },
-            'DC03 Skid': {
-                'name': 'DC03 Skid',
-                'dut_label': 'DC03 Skid (SV/102503/0026) [DUT]',
-                'reference_label': 'DC03 Innerblock (SV/33053/0029) [Reference]',
-                'has_ringdown': False
-            },
-            'IDOD': {
-                'name': 'IDOD',
-                'dut_label': 'IDOD skid [DUT]',
-                'reference_label': 'IDOD Innerblock (SV/33053/0028) [Reference]',
-                'has_ringdown': False,
-                'has_skid_plate': True
-            }
-        }
-        
-        self.setup_ui()
-        self.setup_connections()
-        
-    def setup_ui(self):
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        
-        main_layout = QVBoxLayout(central_widget)
-        
-        self.tabs = QTabWidget()
-        main_layout.addWidget(self.tabs)
-        
-        self.setup_analysis_tab()
-        self.setup_database_tab()
-        self.setup_analytics_tab()
-        self.setup_settings_tab()
-        
-    def setup_analysis_tab(self):
-        analysis_widget = QWidget()
-        layout = QVBoxLayout(analysis_widget)
-        
-        # File operations section
-        file_group = QGroupBox("File Operations")
-        file_layout = QHBoxLayout(file_group)
-        
-        self.load_file_btn = QPushButton("Load CSV File")
-        self.load_file_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; padding: 8px; }")
-        
-        self.file_label = QLabel("No file loaded")
-        self.file_label.setStyleSheet("QLabel { color: #666; }")
-        
-        file_layout.addWidget(self.load_file_btn)
-        file_layout.addWidget(self.file_label)
-        file_layout.addStretch()
-        
-        layout.addWidget(file_group)
-        
-        # Progress bar
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        layout.addWidget(self.progress_bar)
-        
-        # Splitter for main content
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        layout.addWidget(splitter)
-        
-        # Left panel - Configuration and results
-        left_panel = QWidget()
-        left_layout = QVBoxLayout(left_panel)
-        
-        # Test configuration
-        config_group = QGroupBox("Test Configuration")
-        config_layout = QFormLayout(config_group)
-        
-        self.test_type_combo = QComboBox()
-        self.test_type_combo.addItems(list(self.test_type_configs.keys()))
-        config_layout.addRow("Test Type:", self.test_type_combo)
-        
-        self.test_number_edit = QLineEdit()
-        config_layout.addRow("Test Number*:", self.test_number_edit)
-        
-        self.test_bench_edit = QLineEdit()
-        config_layout.addRow("Test Bench*:", self.test_bench_edit)
-        
-        self.tester_id_edit = QLineEdit()
-        config_layout.addRow("Tester ID*:", self.tester_id_edit)
-        
-        self.test_function_combo = QComboBox()
-        self.test_function_combo.addItems([
-            'Leak test', 'Performance test', 'Calibration test',
-            'Endurance test', 'Temperature test', 'Vibration test', 'Pressure test'
-        ])
-        config_layout.addRow("Test Function:", self.test_function_combo)
-        
-        self.skid_plate_combo = QComboBox()
-        self.skid_plate_combo.addItems(['100mm', '150mm', '200mm', '250mm', '300mm'])
-        self.skid_plate_combo.setVisible(False)
-        self.skid_plate_label = QLabel("Skid Plate Diameter:")
-        self.skid_plate_label.setVisible(False)
-        config_layout.addRow(self.skid_plate_label, self.skid_plate_combo)
-        
-        left_layout.addWidget(config_group)
-        
-        # Analysis settings
-        settings_group = QGroupBox("Analysis Settings")
-        settings_layout = QFormLayout(settings_group)
-        
-        self.trigger_current_spin = QDoubleSpinBox()
-        self.trigger_current_spin.setRange(0.1, 100.0)
-        self.trigger_current_spin.setValue(1.0)
-        self.trigger_current_spin.setSuffix(" A")
-        settings_layout.addRow("Trigger Current:", self.trigger_current_spin)
-        
-        self.zoom_start_spin = QSpinBox()
-        self.zoom_start_spin.setRange(0, 99)
-        self.zoom_start_spin.setValue(0)
-        self.zoom_start_spin.setSuffix(" %")
-        settings_layout.addRow("Zoom Start:", self.zoom_start_spin)
-        
-        self.zoom_end_spin = QSpinBox()
-        self.zoom_end_spin.setRange(1, 100)
-        self.zoom_end_spin.setValue(100)
-        self.zoom_end_spin.setSuffix(" %")
-        settings_layout.addRow("Zoom End:", self.zoom_end_spin)
-        
-        left_layout.addWidget(settings_group)
-        
-        # Pass/Fail Criteria
-        criteria_group = QGroupBox("Pass/Fail Criteria")
-        criteria_layout = QFormLayout(criteria_group)
-        
-        # Peak to Peak
-        peak_layout = QHBoxLayout()
-        self.peak_lsl_spin = QDoubleSpinBox()
-        self.peak_lsl_spin.setRange(0, 10000)
-        self.peak_lsl_spin.setValue(150)
-        self.peak_lsl_spin.setSuffix(" mV")
-        self.peak_usl_spin = QDoubleSpinBox()
-        self.peak_usl_spin.setRange(0, 10000)
-        self.peak_usl_spin.setValue(400)
-        self.peak_usl_spin.setSuffix(" mV")
-        peak_layout.addWidget(QLabel("LSL:"))
-        peak_layout.addWidget(self.peak_lsl_spin)
-        peak_layout.addWidget(QLabel("USL:"))
-        peak_layout.addWidget(self.peak_usl_spin)
-        criteria_layout.addRow("Peak-to-Peak:", peak_layout)
-        
-        # Trigger Current
-        trigger_layout = QHBoxLayout()
-        self.trigger_lsl_spin = QDoubleSpinBox()
-        self.trigger_lsl_spin.setRange(0, 1000)
-        self.trigger_lsl_spin.setValue(30)
-        self.trigger_lsl_spin.setSuffix(" A")
-        self.trigger_usl_spin = QDoubleSpinBox()
-        self.trigger_usl_spin.setRange(0, 1000)
-        self.trigger_usl_spin.setValue(80)
-        self.trigger_usl_spin.setSuffix(" A")
-        trigger_layout.addWidget(QLabel("LSL:"))
-        trigger_layout.addWidget(self.trigger_lsl_spin)
-        trigger_layout.addWidget(QLabel("USL:"))
-        trigger_layout.addWidget(self.trigger_usl_spin)
-        criteria_layout.addRow("Trigger Current:", trigger_layout)
-        
-        # Noise
-        noise_layout = QHBoxLayout()
-        self.noise_lsl_spin = QDoubleSpinBox()
-        self.noise_lsl_spin.setRange(0, 1000)
-        self.noise_lsl_spin.setValue(0)
-        self.noise_lsl_spin.setSuffix(" mV")
-        self.noise_usl_spin = QDoubleSpinBox()
-        self.noise_usl_spin.setRange(0, 1000)
-        self.noise_usl_spin.setValue(5)
-        self.noise_usl_spin.setSuffix(" mV")
-        noise_layout.addWidget(QLabel("LSL:"))
-        noise_layout.addWidget(self.noise_lsl_spin)
-        noise_layout.addWidget(QLabel("USL:"))
-        noise_layout.addWidget(self.noise_usl_spin)
-        criteria_layout.addRow("Noise:", noise_layout)
-        
-        # Ringdown (for DC02)
-        ringdown_layout = QHBoxLayout()
-        self.ringdown_lsl_spin = QDoubleSpinBox()
-        self.ringdown_lsl_spin.setRange(0, 1000)
-        self.ringdown_lsl_spin.setValue(0)
-        self.ringdown_lsl_spin.setSuffix(" mV")
-        self.ringdown_usl_spin = QDoubleSpinBox()
-        self.ringdown_usl_spin.setRange(0, 1000)
-        self.ringdown_usl_spin.setValue(100)
-        self.ringdown_usl_spin.setSuffix(" mV")
-        ringdown_layout.addWidget(QLabel("LSL:"))
-        ringdown_layout.addWidget(self.ringdown_lsl_spin)
-        ringdown_layout.addWidget(QLabel("USL:"))
-        ringdown_layout.addWidget(self.ringdown_usl_spin)
-        self.ringdown_row = criteria_layout.addRow("Ringdown:", ringdown_layout)
-        
-        left_layout.addWidget(criteria_group)
-        
-        # Analysis results
-        results_group = QGroupBox("Analysis Results")
-        results_layout = QVBoxLayout(results_group)
-        
-        self.results_text = QTextEdit()
-        self.results_text.setMaximumHeight(200)
-        self.results_text.setReadOnly(True)
-        results_layout.addWidget(self.results_text)
-        
-        # Pass/Fail indicator
-        self.pass_fail_label = QLabel("Status: Not Analyzed")
-        self.pass_fail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.pass_fail_label.setStyleSheet("QLabel { font-size: 16px; font-weight: bold; padding: 8px; }")
-        results_layout.addWidget(self.pass_fail_label)
-        
-        # Action buttons
-        button_layout = QHBoxLayout()
-        self.analyze_btn = QPushButton("Analyze")
-        self.analyze_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; padding: 8px; }")
-        self.analyze_btn.setEnabled(False)  # Disabled until file is loaded
-        
-        self.save_btn = QPushButton("Save to Database")
-        self.save_btn.setStyleSheet("QPushButton { background-color: #FF9800; color: white; padding: 8px; }")
-        self.save_btn.setEnabled(False)
-        
-        button_layout.addWidget(self.analyze_btn)
-        button_layout.addWidget(self.save_btn)
-        results_layout.addLayout(button_layout)
-        
-        left_layout.addWidget(results_group)
-        left_layout.addStretch()
-        
-        # Right panel - Chart
-        right_panel = QWidget()
-        right_layout = QVBoxLayout(right_panel)
-        right_layout.addWidget(QLabel("Waveform Analysis"))
-        
-        self.chart_widget = MatplotlibWidget()
-        right_layout.addWidget(self.chart_widget)
-        
-        # Set splitter proportions
-        splitter.addWidget(left_panel)
-        splitter.addWidget(right_panel)
-        splitter.setSizes([400, 800])
-        
-        self.tabs.addTab(analysis_widget, "Analysis")
-        
-    def setup_database_tab(self):
-        db_widget = QWidget()
-        layout = QVBoxLayout(db_widget)
-        
-        # Database connection info
-        conn_group = QGroupBox("Database Connection")
-        conn_layout = QFormLayout(conn_group)
-        
-        self.db_host_edit = QLineEdit("localhost")
-        conn_layout.addRow("Host:", self.db_host_edit)
-        
-        self.db_port_edit = QLineEdit("5432")
-        conn_layout.addRow("Port:", self.db_port_edit)
-        
-        self.db_name_edit = QLineEdit("oscilloscope_db")
-        conn_layout.addRow("Database:", self.db_name_edit)
-        
-        self.db_user_edit = QLineEdit("oscuser")
-        conn_layout.addRow("Username:", self.db_user_edit)
-        
-        self.db_password_edit = QLineEdit("oscpassword123")
-        self.db_password_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        conn_layout.addRow("Password:", self.db_password_edit)
-        
-        self.test_connection_btn = QPushButton("Test Connection")
-        conn_layout.addRow("", self.test_connection_btn)
-        
-        layout.addWidget(conn_group)
-        
-        # Results table
-        results_group = QGroupBox("Saved Results")
-        results_layout = QVBoxLayout(results_group)
-        
-        # Filter controls
-        filter_layout = QHBoxLayout()
-        filter_layout.addWidget(QLabel("Test Type:"))
-        self.filter_combo = QComboBox()
-        self.filter_combo.addItems(['All'] + list(self.test_type_configs.keys()))
-        filter_layout.addWidget(self.filter_combo)
-        
-        self.refresh_btn = QPushButton("Refresh")
-        filter_layout.addWidget(self.refresh_btn)
-        filter_layout.addStretch()
-        
-        results_layout.addLayout(filter_layout)
-        
-        # Results table
-        self.results_table = QTableWidget()
-        results_layout.addWidget(self.results_table)
-        
-        layout.addWidget(results_group)
-        
-        self.tabs.addTab(db_widget, "Database")
-    
-    def setup_analytics_tab(self):
-        analytics_widget = QWidget()
-        layout = QVBoxLayout(analytics_widget)
-        
-        # Filters section
-        filters_group = QGroupBox("Data Filters")
-        filters_layout = QGridLayout(filters_group)
-        
-        # Test type filter
-        filters_layout.addWidget(QLabel("Test Type:"), 0, 0)
-        self.analytics_test_type_combo = QComboBox()
-        self.analytics_test_type_combo.addItems(['All'] + list(self.test_type_configs.keys()))
-        filters_layout.addWidget(self.analytics_test_type_combo, 0, 1)
-        
-        # Pass/Fail filter
-        filters_layout.addWidget(QLabel("Result:"), 0, 2)
-        self.analytics_pass_fail_combo = QComboBox()
-        self.analytics_pass_fail_combo.addItems(['All', 'Pass', 'Fail'])
-        filters_layout.addWidget(self.analytics_pass_fail_combo, 0, 3)
-        
-        # Tester filter
-        filters_layout.addWidget(QLabel("Tester ID:"), 1, 0)
-        self.analytics_tester_edit = QLineEdit()
-        self.analytics_tester_edit.setPlaceholderText("Filter by tester...")
-        filters_layout.addWidget(self.analytics_tester_edit, 1, 1)
-        
-        # Test bench filter
-        filters_layout.addWidget(QLabel("Test Bench:"), 1, 2)
-        self.analytics_bench_edit = QLineEdit()
-        self.analytics_bench_edit.setPlaceholderText("Filter by test bench...")
-        filters_layout.addWidget(self.analytics_bench_edit, 1, 3)
-        
-        # Date filters
-        filters_layout.addWidget(QLabel("Date From:"), 2, 0)
-        self.analytics_date_from = QDateEdit()
-        self.analytics_date_from.setDate(QDate.currentDate().addDays(-30))
-        self.analytics_date_from.setCalendarPopup(True)
-        filters_layout.addWidget(self.analytics_date_from, 2, 1)
-        
-        filters_layout.addWidget(QLabel("Date To:"), 2, 2)
-        self.analytics_date_to = QDateEdit()
-        self.analytics_date_to.setDate(QDate.currentDate())
-        self.analytics_date_to.setCalendarPopup(True)
-        filters_layout.addWidget(self.analytics_date_to, 2, 3)
-        
-        # Filter buttons
-        filter_btn_layout = QHBoxLayout()
-        self.apply_filters_btn = QPushButton("Apply Filters")
-        self.apply_filters_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; padding: 8px; }")
-        self.clear_filters_btn = QPushButton("Clear Filters")
-        self.clear_filters_btn.setStyleSheet("QPushButton { background-color: #9E9E9E; color: white; padding: 8px; }")
-        filter_btn_layout.addWidget(self.apply_filters_btn)
-        filter_btn_layout.addWidget(self.clear_filters_btn)
-        filter_btn_layout.addStretch()
-        
-        filters_layout.addLayout(filter_btn_layout, 3, 0, 1, 4)
-        
-        layout.addWidget(filters_group)
-        
-        # Create splitter for analytics content
-        analytics_splitter = QSplitter(Qt.Orientation.Horizontal)
-        layout.addWidget(analytics_splitter)
-        
-        # Left panel - Summary statistics
-        stats_panel = QWidget()
-        stats_layout = QVBoxLayout(stats_panel)
-        
-        # Summary metrics
-        summary_group = QGroupBox("Summary Metrics")
-        summary_layout = QVBoxLayout(summary_group)
-        
-        self.analytics_summary_text = QTextEdit()
-        self.analytics_summary_text.setMaximumHeight(300)
-        self.analytics_summary_text.setReadOnly(True)
-        summary_layout.addWidget(self.analytics_summary_text)
-        
-        stats_layout.addWidget(summary_group)
-        
-        # Detailed breakdown table
-        breakdown_group = QGroupBox("Detailed Breakdown")
-        breakdown_layout = QVBoxLayout(breakdown_group)
-        
-        self.analytics_breakdown_table = QTableWidget()
-        self.analytics_breakdown_table.setMaximumHeight(250)
-        breakdown_layout.addWidget(self.analytics_breakdown_table)
-        
-        stats_layout.addWidget(breakdown_group)
-        
-        # Right panel - Charts
-        charts_panel = QWidget()
-        charts_layout = QVBoxLayout(charts_panel)
-        charts_layout.addWidget(QLabel("Analytics Charts"))
-        
-        self.analytics_chart_widget = MatplotlibWidget()
-        charts_layout.addWidget(self.analytics_chart_widget)
-        
-        analytics_splitter.addWidget(stats_panel)
-        analytics_splitter.addWidget(charts_panel)
-        analytics_splitter.setSizes([400, 800])
-        
-        self.tabs.addTab(analytics_widget, "Analytics")
-        
-    def setup_settings_tab(self):
-        settings_widget = QWidget()
-        layout = QVBoxLayout(settings_widget)
-        
-        # Export settings
-        export_group = QGroupBox("Export Settings")
-        export_layout = QVBoxLayout(export_group)
-        
-        self.export_sql_btn = QPushButton("Export Database Schema")
-        self.export_results_btn = QPushButton("Export Results to CSV")
-        
-        export_layout.addWidget(self.export_sql_btn)
-        export_layout.addWidget(self.export_results_btn)
-        
-        layout.addWidget(export_group)
-        layout.addStretch()
-        
-        self.tabs.addTab(settings_widget, "Settings")
-        
-    def setup_connections(self):
-        # File operations
-        self.load_file_btn.clicked.connect(self.load_file)
-        
-        # Analysis
-        self.analyze_btn.clicked.connect(self.analyze_data)
-        self.save_btn.clicked.connect(self.save_analysis)
-        
-        # Settings changes
-        self.test_type_combo.currentTextChanged.connect(self.on_test_type_changed)
-        self.trigger_current_spin.valueChanged.connect(self.update_chart)
-        self.zoom_start_spin.valueChanged.connect(self.update_chart)
-        self.zoom_end_spin.valueChanged.connect(self.update_chart)
-        
-        # Database
-        self.test_connection_btn.clicked.connect(self.test_db_connection)
-        self.refresh_btn.clicked.connect(self.refresh_results)
-        
-        # Analytics connections
-        self.apply_filters_btn.clicked.connect(self.update_analytics)
-        self.clear_filters_btn.clicked.connect(self.clear_analytics_filters)
-        
-        # Export
-        self.export_sql_btn.clicked.connect(self.export_schema)
-        self.export_results_btn.clicked.connect(self.export_results)
-        
-    def load_file(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, 
-            "Load Oscilloscope CSV File", 
-            "", 
-            "CSV Files (*.csv);;All Files (*)"
-        )
-        
-        if file_path:
-            self.file_label.setText(f"Loaded: {os.path.basename(file_path)}")
-            self.current_file_path = file_path
-            self.analyze_btn.setEnabled(True)
-            
-    def analyze_data(self):
-        if not hasattr(self, 'current_file_path') or not self.current_file_path:
-            QMessageBox.warning(self, "Warning", "Please load a CSV file first.")
-            return
-            
-        # Show progress bar
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-        
-        # Start analysis in separate thread
-        self.analysis_worker = AnalysisWorker(
-            self.current_file_path, 
-            self.trigger_current_spin.value()
-        )
-        self.analysis_worker.progress.connect(self.progress_bar.setValue)
-        self.analysis_worker.finished.connect(self.on_analysis_finished)
-        self.analysis_worker.start()
-        
-    def on_analysis_finished(self, analysis_data):
-        self.progress_bar.setVisible(False)
-        self.current_analysis = analysis_data
-        
-        if not analysis_data:
-            QMessageBox.critical(self, "Error", "Failed to analyze data.")
-            return
-            
-        # Update results display
-        self.update_results_display()
-        self.update_chart()
-        self.save_btn.setEnabled(True)
-        
-    def update_results_display(self):
-        if not self.current_analysis:
-            return
-            
-        # Extract analysis data
-        ch1 = self.current_analysis.get('ch1', {})
-        ch2 = self.current_analysis.get('ch2', {})
-        trigger = self.current_analysis.get('trigger', {})
-        metadata = self.current_analysis.get('metadata', {})
-        
-        # Format results text
-        results_text = f"""
-CHANNEL 1 (Voltage):
-  Peak-to-Peak: {ch1.get('peak_to_peak', 0):.3f} mV
-  Min/Max: {ch1.get('min', 0):.3f} / {ch1.get('max', 0):.3f} V
-  RMS: {ch1.get('rms', 0):.3f} V
-  Noise: {ch1.get('noise', 0):.3f} mV
-  Ringdown: {ch1.get('ringdown', {}).get('ringdown_voltage', 0):.3f} mV
-
-CHANNEL 2 (Current):
-  Peak-to-Peak: {ch2.get('peak_to_peak', 0):.3f} A
-  Min/Max: {ch2.get('min', 0):.3f} / {ch2.get('max', 0):.3f} A
-  RMS: {ch2.get('rms', 0):.3f} A
-
-TRIGGER ANALYSIS:
-  Threshold: {trigger.get('threshold', 0):.1f} A
-  Events: {trigger.get('count', 0)}
-
-METADATA:
-  Data Points: {metadata.get('data_points', 0)}
-  Sample Rate: {metadata.get('sample_rate', 0):.1f} Hz
-  Duration: {metadata.get('duration', 0):.3f} ms
-        """
-        
-        self.results_text.setText(results_text.strip())
-        
-        # Evaluate pass/fail
-        pass_fail_result = self.evaluate_pass_fail()
-        
-        if pass_fail_result['overall'] == 'pass':
-            self.pass_fail_label.setText("Status: PASS ✓")
-            self.pass_fail_label.setStyleSheet(
-                "QLabel { background-color: #4CAF50; color: white; font-size: 16px; font-weight: bold; padding: 8px; }"
-            )
-        else:
-            self.pass_fail_label.setText("Status: FAIL ✗")
-            self.pass_fail_label.setStyleSheet(
-                "QLabel { background-color: #F44336; color: white; font-size: 16px; font-weight: bold; padding: 8px; }"
-            )
-            
-    def evaluate_pass_fail(self):
-        if not self.current_analysis:
-            return {'overall': 'unknown', 'details': {}}
-            
-        ch1 = self.current_analysis.get('ch1', {})
-        
-        # Get criteria values
-        peak_lsl = self.peak_lsl_spin.value()
-        peak_usl = self.peak_usl_spin.value()
-        trigger_lsl = self.trigger_lsl_spin.value()
-        trigger_usl = self.trigger_usl_spin.value()
-        noise_lsl = self.noise_lsl_spin.value()
-        noise_usl = self.noise_usl_spin.value()
-        
-        # Evaluate criteria
-        results = {
-            'peak_to_peak': peak_lsl <= ch1.get('peak_to_peak', 0) <= peak_usl,
-            'trigger_current': trigger_lsl <= self.trigger_current_spin.value() <= trigger_usl,
-            'noise': noise_lsl <= ch1.get('noise', 0) <= noise_usl
-        }
-        
-        # Add ringdown check for DC02
-        if self.test_type_configs[self.test_type_combo.currentText()].get('has_ringdown', False):
-            ringdown_lsl = self.ringdown_lsl_spin.value()
-            ringdown_usl = self.ringdown_usl_spin.value()
-            ringdown_voltage = ch1.get('ringdown', {}).get('ringdown_voltage', 0)
-            results['ringdown'] = ringdown_lsl <= ringdown_voltage <= ringdown_usl
-        else:
-            results['ringdown'] = True
-            
-        overall = 'pass' if all(results.values()) else 'fail'
-        
-        return {'overall': overall, 'details': results}
-        
-    def update_chart(self):
-        if self.current_analysis:
-            zoom_range = (self.zoom_start_spin.value(), self.zoom_end_spin.value())
-            self.chart_widget.plot_data(
-                self.current_analysis, 
-                self.trigger_current_spin.value(), 
-                zoom_range
-            )
-            
-    def on_test_type_changed(self, test_type):
-        # Show/hide skid plate diameter for IDOD
-        is_idod = self.test_type_configs[test_type].get('has_skid_plate', False)
-        self.skid_plate_combo.setVisible(is_idod)
-        self.skid_plate_label.setVisible(is_idod)
-        
-        # Show/hide ringdown criteria for DC02
-        has_ringdown = self.test_type_configs[test_type].get('has_ringdown', False)
-        # Note: You might need to implement showing/hiding the ringdown row
-        
-    def save_analysis(self):
-        if not self.current_analysis:
-            QMessageBox.warning(self, "Warning", "No analysis data to save.")
-            return
-            
-        # Validate required fields
-        required_fields = [
-            (self.test_number_edit, "Test Number"),
-            (self.test_bench_edit, "Test Bench"),
-            (self.tester_id_edit, "Tester ID")
-        ]
-        
-        missing_fields = []
-        for field, name in required_fields:
-            if not field.text().strip():
-                missing_fields.append(name)
-                
-        if missing_fields:
-            QMessageBox.warning(
-                self, 
-                "Missing Fields", 
-                f"Please fill in the following required fields:\n{', '.join(missing_fields)}"
-            )
-            return
-            
-        # Prepare data for database
-        ch1 = self.current_analysis.get('ch1', {})
-        ch2 = self.current_analysis.get('ch2', {})
-        trigger = self.current_analysis.get('trigger', {})
-        metadata = self.current_analysis.get('metadata', {})
-        pass_fail_result = self.evaluate_pass_fail()
-        
-        data = {
-            'file_name': os.path.basename(self.current_file_path),
-            'test_number': self.test_number_edit.text(),
-            'test_bench': self.test_bench_edit.text(),
-            'tester_id': self.tester_id_edit.text(),
-            'test_date': datetime.now().date(),
-            'analysis_date': datetime.now(),
-            'dut_device': self.test_type_configs[self.test_type_combo.currentText()]['dut_label'],
-            'reference_device': self.test_type_configs[self.test_type_combo.currentText()]['reference_label'],
-            'test_function': self.test_function_combo.currentText(),
-            'peak_to_peak_mv': ch1.get('peak_to_peak', 0),
-            'trigger_current_a': self.trigger_current_spin.value(),
-            'noise_mv': ch1.get('noise', 0),
-            'frequency_khz': metadata.get('sample_rate', 0) / 1000,
-            'data_points': metadata.get('data_points', 0),
-            'sample_rate_khz': metadata.get('sample_rate', 0) / 1000,
-            'peak_to_peak_lsl': self.peak_lsl_spin.value(),
-            'peak_to_peak_usl': self.peak_usl_spin.value(),
-            'trigger_current_lsl': self.trigger_lsl_spin.value(),
-            'trigger_current_usl': self.trigger_usl_spin.value(),
-            'noise_lsl': self.noise_lsl_spin.value(),
-            'noise_usl': self.noise_usl_spin.value(),
-            'trigger_events': trigger.get('count', 0),
-            'pass_fail': pass_fail_result['overall']
-        }
-        
-        # Add optional fields
-        test_type = self.test_type_combo.currentText()
-        if self.test_type_configs[test_type].get('has_ringdown', False):
-            data['ringdown_voltage_mv'] = ch1.get('ringdown', {}).get('ringdown_voltage', 0)
-            data['ringdown_lsl'] = self.ringdown_lsl_spin.value()
-            data['ringdown_usl'] = self.ringdown_usl_spin.value()
-            
-        if self.test_type_configs[test_type].get('has_skid_plate', False):
-            data['skid_plate_diameter'] = self.skid_plate_combo.currentText()
-            
-        # Save to database
-        if self.db_manager.save_analysis(test_type, data):
-            QMessageBox.information(
-                self, 
-                "Success", 
-                f"Analysis saved successfully!\nResult: {pass_fail_result['overall'].upper()}"
-            )
-            self.refresh_results()
-            # Only update analytics if analytics widgets exist
-            try:
-                self.update_analytics()
-            except AttributeError:
-                pass  # Analytics tab not initialized yet
-        else:
-            QMessageBox.critical(self, "Error", "Failed to save analysis to database.")
-            
-    def test_db_connection(self):
-        # Update connection parameters
-        self.db_manager.connection_params.update({
-            'host': self.db_host_edit.text(),
-            'port': self.db_port_edit.text(),
-            'database': self.db_name_edit.text(),
-            'user': self.db_user_edit.text(),
-            'password': self.db_password_edit.text()
-        })
-        
-        conn = self.db_manager.connect()
-        if conn:
-            conn.close()
-            QMessageBox.information(self, "Success", "Database connection successful!")
-        else:
-            QMessageBox.critical(self, "Error", "Failed to connect to database.")
-            
-    def refresh_results(self):
-        test_type = self.filter_combo.currentText()
-        if test_type == 'All':
-            results = self.db_manager.get_all_results()
-        else:
-            results = self.db_manager.get_results(test_type)
-            
-        # Update table
-        if results:
-            self.results_table.setRowCount(len(results))
-            self.results_table.setColumnCount(len(results[0]))
-            self.results_table.setHorizontalHeaderLabels(list(results[0].keys()))
-            
-            for row, result in enumerate(results):
-                for col, (key, value) in enumerate(result.items()):
-                    item = QTableWidgetItem(str(value))
-                    self.results_table.setItem(row, col, item)
-            
-            # Auto-resize columns
-            self.results_table.resizeColumnsToContents()
-        else:
-            self.results_table.setRowCount(0)
-    
-    def update_analytics(self):
-        """Update analytics tab with current filters"""
-        try:
-            filters = self.get_analytics_filters()
-            summary_data = self.db_manager.get_analytics_summary(filters)
-            
-            if not summary_data:
-                self.analytics_summary_text.setText("No data available with current filters.")
-                self.analytics_breakdown_table.setRowCount(0)
-                self.analytics_chart_widget.plot_analytics_charts({})
-                return
-            
-            # Update summary text
-            summary = summary_data.get('summary', {})
-            test_types = summary_data.get('test_types', {})
-            testers = summary_data.get('testers', {})
-            test_benches = summary_data.get('test_benches', {})
-            parameters = summary_data.get('parameters', {})
-            
-            summary_text = f"""
-OVERALL SUMMARY:
-  Total Tests: {summary.get('total_tests', 0)}
-  Pass Count: {summary.get('pass_count', 0)}
-  Fail Count: {summary.get('fail_count', 0)}
-  Overall Pass Rate: {summary.get('pass_rate', 0):.1f}%
-  Recent Pass Rate (30 days): {summary.get('recent_pass_rate', 0):.1f}%
-  Recent Tests: {summary.get('recent_tests', 0)}
-
-PARAMETER STATISTICS:
-  Peak-to-Peak (mV):
-    Mean: {parameters.get('peak_to_peak', {}).get('mean', 0):.2f}
-    Std Dev: {parameters.get('peak_to_peak', {}).get('std', 0):.2f}
-    Range: {parameters.get('peak_to_peak', {}).get('min', 0):.2f} - {parameters.get('peak_to_peak', {}).get('max', 0):.2f}
-        
-  Trigger Current (A):
-    Mean: {parameters.get('trigger_current', {}).get('mean', 0):.2f}
-    Std Dev: {parameters.get('trigger_current', {}).get('std', 0):.2f}
-    Range: {parameters.get('trigger_current', {}).get('min', 0):.2f} - {parameters.get('trigger_current', {}).get('max', 0):.2f}
-        
-  Noise (mV):
-    Mean: {parameters.get('noise', {}).get('mean', 0):.2f}
-    Std Dev: {parameters.get('noise', {}).get('std', 0):.2f}
-    Range: {parameters.get('noise', {}).get('min', 0):.2f} - {parameters.get('noise', {}).get('max', 0):.2f}
-            """
-            
-            self.analytics_summary_text.setText(summary_text.strip())
-            
-            # Update breakdown table
-            breakdown_data = []
-            
-            # Add test type breakdown
-            for test_type, stats in test_types.items():
-                pass_rate = (stats['pass'] / stats['total'] * 100) if stats['total'] > 0 else 0
-                breakdown_data.append({
-                    'Category': 'Test Type',
-                    'Name': test_type,
-                    'Total Tests': stats['total'],
-                    'Pass': stats['pass'],
-                    'Fail': stats['fail'],
-                    'Pass Rate (%)': f"{pass_rate:.1f}"
-                })
-            
-            # Add tester breakdown
-            for tester, stats in testers.items():
-                pass_rate = (stats['pass'] / stats['total'] * 100) if stats['total'] > 0 else 0
-                breakdown_data.append({
-                    'Category': 'Tester',
-                    'Name': tester,
-                    'Total Tests': stats['total'],
-                    'Pass': stats['pass'],
-                    'Fail': stats['fail'],
-                    'Pass Rate (%)': f"{pass_rate:.1f}"
-                })
-            
-            # Add test bench breakdown
-            for bench, stats in test_benches.items():
-                pass_rate = (stats['pass'] / stats['total'] * 100) if stats['total'] > 0 else 0
-                breakdown_data.append({
-                    'Category': 'Test Bench',
-                    'Name': bench,
-                    'Total Tests': stats['total'],
-                    'Pass': stats['pass'],
-                    'Fail': stats['fail'],
-                    'Pass Rate (%)': f"{pass_rate:.1f}"
-                })
-            
-            if breakdown_data:
-                self.analytics_breakdown_table.setRowCount(len(breakdown_data))
-                self.analytics_breakdown_table.setColumnCount(len(breakdown_data[0]))
-                self.analytics_breakdown_table.setHorizontalHeaderLabels(list(breakdown_data[0].keys()))
-                
-                for row, data_row in enumerate(breakdown_data):
-                    for col, (key, value) in enumerate(data_row.items()):
-                        item = QTableWidgetItem(str(value))
-                        self.analytics_breakdown_table.setItem(row, col, item)
-                
-                self.analytics_breakdown_table.resizeColumnsToContents()
-            
-            # Update charts
-            self.analytics_chart_widget.plot_analytics_charts(summary_data)
-            
-        except Exception as e:
-            print(f"Analytics update error: {e}")
-    
-    def get_analytics_filters(self):
-        """Get current analytics filters"""
-        filters = {}
-        
-        if self.analytics_test_type_combo.currentText() != 'All':
-            filters['test_type'] = self.analytics_test_type_combo.currentText()
-        
-        if self.analytics_pass_fail_combo.currentText() != 'All':
-            filters['pass_fail'] = self.analytics_pass_fail_combo.currentText()
-        
-        if self.analytics_tester_edit.text().strip():
-            filters['tester_id'] = self.analytics_tester_edit.text().strip()
-        
-        if self.analytics_bench_edit.text().strip():
-            filters['test_bench'] = self.analytics_bench_edit.text().strip()
-        
-        # Fix the date conversion issue - use getDate() method
-        try:
-            date_from = self.analytics_date_from.date()
-            date_to = self.analytics_date_to.date()
-            
-            # Convert QDate to Python date
-            filters['date_from'] = datetime(date_from.year(), date_from.month(), date_from.day()).date()
-            filters['date_to'] = datetime(date_to.year(), date_to.month(), date_to.day()).date()
-        except AttributeError:
-            # Fallback for different PyQt6 versions
-            import datetime as dt
-            filters['date_from'] = dt.date.today() - timedelta(days=30)
-            filters['date_to'] = dt.date.today()
-        
-        return filters
-    
-    def clear_analytics_filters(self):
-        """Clear all analytics filters"""
-        self.analytics_test_type_combo.setCurrentText('All')
-        self.analytics_pass_fail_combo.setCurrentText('All')
-        self.analytics_tester_edit.clear()
-        self.analytics_bench_edit.clear()
-        self.analytics_date_from.setDate(QDate.currentDate().addDays(-30))
-        self.analytics_date_to.setDate(QDate.currentDate())
-        self.update_analytics()
-            
-    def export_schema(self):
-        schema_sql = self.generate_database_schema()
-        
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, 
-            "Export Database Schema", 
-            "oscilloscope_schema.sql", 
-            "SQL Files (*.sql);;All Files (*)"
-        )
-        
-        if file_path:
-            with open(file_path, 'w') as f:
-                f.write(schema_sql)
-            QMessageBox.information(self, "Success", f"Schema exported to {file_path}")
-            
-    def export_results(self):
-        """Export filtered results to CSV"""
-        try:
-            # Get current filters if on analytics tab, otherwise get all results
-            if self.tabs.currentIndex() == 2:  # Analytics tab
-                filters = self.get_analytics_filters()
-                results = self.db_manager.get_all_results(filters)
-                default_filename = f"analytics_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            else:
-                test_type = self.filter_combo.currentText()
-                if test_type == 'All':
-                    results = self.db_manager.get_all_results()
-                else:
-                    results = self.db_manager.get_results(test_type)
-                default_filename = f"test_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            
-            if not results:
-                QMessageBox.warning(self, "Warning", "No data to export.")
-                return
-            
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, 
-                "Export Results to CSV", 
-                default_filename, 
-                "CSV Files (*.csv);;All Files (*)"
-            )
-            
-            if file_path:
-                # Create DataFrame and export
-                df = pd.DataFrame(results)
-                
-                # Remove internal columns
-                columns_to_remove = ['source_table']
-                for col in columns_to_remove:
-                    if col in df.columns:
-                        df = df.drop(columns=[col])
-                
-                # Export to CSV
-                df.to_csv(file_path, index=False)
-                
-                QMessageBox.information(
-                    self, 
-                    "Success", 
-                    f"Results exported successfully!\nFile: {file_path}\nRecords: {len(results)}"
-                )
-                
-        except Exception as e:
-            QMessageBox.critical(self, "Export Error", f"Failed to export results:\n{str(e)}")
-        
-    def generate_database_schema(self):
-        return """-- Oscilloscope Analysis Database Schema
--- Run this in PostgreSQL to create the required tables
-
--- DTT Analysis Table
-CREATE TABLE IF NOT EXISTS dtt_analysis (
-    id SERIAL PRIMARY KEY,
-    file_name VARCHAR(255) NOT NULL,
-    test_number VARCHAR(50) NOT NULL,
-    test_bench VARCHAR(100) NOT NULL,
-    tester_id VARCHAR(50) NOT NULL,
-    test_date DATE NOT NULL,
-    analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    dut_device VARCHAR(255),
-    reference_device VARCHAR(255),
-    test_function VARCHAR(100),
-    peak_to_peak_mv DECIMAL(10,3),
-    trigger_current_a DECIMAL(10,3),
-    noise_mv DECIMAL(10,3),
-    frequency_khz DECIMAL(10,3),
-    data_points INTEGER,
-    sample_rate_khz DECIMAL(10,3),
-    peak_to_peak_lsl DECIMAL(10,3),
-    peak_to_peak_usl DECIMAL(10,3),
-    trigger_current_lsl DECIMAL(10,3),
-    trigger_current_usl DECIMAL(10,3),
-    noise_lsl DECIMAL(10,3),
-    noise_usl DECIMAL(10,3),
-    trigger_events INTEGER,
-    pass_fail VARCHAR(10)
-);
-
--- DC02 Analysis Table (includes ringdown)
-CREATE TABLE IF NOT EXISTS dc02_analysis (
-    id SERIAL PRIMARY KEY,
-    file_name VARCHAR(255) NOT NULL,
-    test_number VARCHAR(50) NOT NULL,
-    test_bench VARCHAR(100) NOT NULL,
-    tester_id VARCHAR(50) NOT NULL,
-    test_date DATE NOT NULL,
-    analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    dut_device VARCHAR(255),
-    reference_device VARCHAR(255),
-    test_function VARCHAR(100),
-    peak_to_peak_mv DECIMAL(10,3),
-    trigger_current_a DECIMAL(10,3),
-    noise_mv DECIMAL(10,3),
-    ringdown_voltage_mv DECIMAL(10,3),
-    frequency_khz DECIMAL(10,3),
-    data_points INTEGER,
-    sample_rate_khz DECIMAL(10,3),
-    peak_to_peak_lsl DECIMAL(10,3),
-    peak_to_peak_usl DECIMAL(10,3),
-    trigger_current_lsl DECIMAL(10,3),
-    trigger_current_usl DECIMAL(10,3),
-    noise_lsl DECIMAL(10,3),
-    noise_usl DECIMAL(10,3),
-    ringdown_lsl DECIMAL(10,3),
-    ringdown_usl DECIMAL(10,3),
-    trigger_events INTEGER,
-    pass_fail VARCHAR(10)
-);
-
--- DTR Analysis Table
-CREATE TABLE IF NOT EXISTS dtr_analysis (
-    id SERIAL PRIMARY KEY,
-    file_name VARCHAR(255) NOT NULL,
-    test_number VARCHAR(50) NOT NULL,
-    test_bench VARCHAR(100) NOT NULL,
-    tester_id VARCHAR(50) NOT NULL,
-    test_date DATE NOT NULL,
-    analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    dut_device VARCHAR(255),
-    reference_device VARCHAR(255),
-    test_function VARCHAR(100),
-    peak_to_peak_mv DECIMAL(10,3),
-    trigger_current_a DECIMAL(10,3),
-    noise_mv DECIMAL(10,3),
-    frequency_khz DECIMAL(10,3),
-    data_points INTEGER,
-    sample_rate_khz DECIMAL(10,3),
-    peak_to_peak_lsl DECIMAL(10,3),
-    peak_to_peak_usl DECIMAL(10,3),
-    trigger_current_lsl DECIMAL(10,3),
-    trigger_current_usl DECIMAL(10,3),
-    noise_lsl DECIMAL(10,3),
-    noise_usl DECIMAL(10,3),
-    trigger_events INTEGER,
-    pass_fail VARCHAR(10)
-);
-
--- DC03 Skid Analysis Table
-CREATE TABLE IF NOT EXISTS dc03_skid_analysis (
-    id SERIAL PRIMARY KEY,
-    file_name VARCHAR(255) NOT NULL,
-    test_number VARCHAR(50) NOT NULL,
-    test_bench VARCHAR(100) NOT NULL,
-    tester_id VARCHAR(50) NOT NULL,
-    test_date DATE NOT NULL,
-    analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    dut_device VARCHAR(255),
-    reference_device VARCHAR(255),
-    test_function VARCHAR(100),
-    peak_to_peak_mv DECIMAL(10,3),
-    trigger_current_a DECIMAL(10,3),
-    noise_mv DECIMAL(10,3),
-    frequency_khz DECIMAL(10,3),
-    data_points INTEGER,
-    sample_rate_khz DECIMAL(10,3),
-    peak_to_peak_lsl DECIMAL(10,3),
-    peak_to_peak_usl DECIMAL(10,3),
-    trigger_current_lsl DECIMAL(10,3),
-    trigger_current_usl DECIMAL(10,3),
-    noise_lsl DECIMAL(10,3),
-    noise_usl DECIMAL(10,3),
-    trigger_events INTEGER,
-    pass_fail VARCHAR(10)
-);
-
--- IDOD Analysis Table (includes skid plate diameter)
-CREATE TABLE IF NOT EXISTS idod_analysis (
-    id SERIAL PRIMARY KEY,
-    file_name VARCHAR(255) NOT NULL,
-    test_number VARCHAR(50) NOT NULL,
-    test_bench VARCHAR(100) NOT NULL,
-    tester_id VARCHAR(50) NOT NULL,
-    test_date DATE NOT NULL,
-    analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    dut_device VARCHAR(255),
-    reference_device VARCHAR(255),
-    skid_plate_diameter VARCHAR(50),
-    test_function VARCHAR(100),
-    peak_to_peak_mv DECIMAL(10,3),
-    trigger_current_a DECIMAL(10,3),
-    noise_mv DECIMAL(10,3),
-    frequency_khz DECIMAL(10,3),
-    data_points INTEGER,
-    sample_rate_khz DECIMAL(10,3),
-    peak_to_peak_lsl DECIMAL(10,3),
-    peak_to_peak_usl DECIMAL(10,3),
-    trigger_current_lsl DECIMAL(10,3),
-    trigger_current_usl DECIMAL(10,3),
-    noise_lsl DECIMAL(10,3),
-    noise_usl DECIMAL(10,3),
-    trigger_events INTEGER,
-    pass_fail VARCHAR(10)
-);
-
--- Insert some sample data for testing
-INSERT INTO dtt_analysis (
-    file_name, test_number, test_bench, tester_id, test_date, test_function,
-    dut_device, reference_device, peak_to_peak_mv, trigger_current_a, noise_mv,
-    frequency_khz, data_points, sample_rate_khz, peak_to_peak_lsl, peak_to_peak_usl,
-    trigger_current_lsl, trigger_current_usl, noise_lsl, noise_usl, trigger_events, pass_fail
-) VALUES (
-    'sample_test.csv', 'T001', 'Bench A', 'admin', CURRENT_DATE, 'Performance test',
-    'DTT (SV/33053/0020) [DUT]', 'DTR (SV/33053/0031) [Reference]', 350.5, 55.2, 2.1,
-    250.0, 2000, 250.0, 150, 400, 30, 80, 0, 5, 3, 'pass'
-);"""
-
-def main():
-    app = QApplication(sys.argv)
-    
-    # Set application style
-    app.setStyle('Fusion')
-    
-    # Set dark theme
-    dark_palette = QPalette()
-    dark_palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255))
-    dark_palette.setColor(QPalette.ColorRole.Base, QColor(25, 25, 25))
-    dark_palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(0, 0, 0))
-    dark_palette.setColor(QPalette.ColorRole.ToolTipText, QColor(255, 255, 255))
-    dark_palette.setColor(QPalette.ColorRole.Text, QColor(255, 255, 255))
-    dark_palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-    dark_palette.setColor(QPalette.ColorRole.ButtonText, QColor(255, 255, 255))
-    dark_palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 0, 0))
-    dark_palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-    dark_palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-    dark_palette.setColor(QPalette.ColorRole.HighlightedText, QColor(0, 0, 0))
-    app.setPalette(dark_palette)
-    
-    # Create and show main window
-    window = OscilloscopeAnalyzer()
-    window.show()
-    
-    sys.exit(app.exec())
-
-if __name__ == '__main__':
+# oscilloscope_analyzer.py
+import sys
+import os
+import csv
+import time
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use("QtAgg")
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+import psycopg2
+import psycopg2.extras
+import psycopg2.pool
+from array import array
+from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+                             QHBoxLayout, QGridLayout, QLabel, QLineEdit, QPushButton,
+                             QComboBox, QSpinBox, QDoubleSpinBox, QTextEdit, QTabWidget,
+                             QTableView, QFileDialog, QMessageBox,
+                             QGroupBox, QFormLayout, QCheckBox, QProgressBar, QSplitter,
+                             QScrollArea, QFrame, QDateEdit, QHeaderView)
+from PyQt6.QtCore import (Qt, QThread, pyqtSignal, QTimer, QDate,
+                          QAbstractTableModel, QModelIndex)
+from PyQt6.QtGui import QFont, QPalette, QColor, QIcon
+
+try:
+    import pyqtgraph as pg
+except ImportError:
+    pg = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    # The trigger scan is a state machine, which plain NumPy can only
+    # express by materializing intermediate masks; the jitted loop avoids that
+    @njit(cache=True)
+    def _find_trigger_indices(ch2, threshold):
+        out = np.empty(len(ch2), np.int64)
+        n = 0
+        prev = abs(ch2[0]) > threshold
+        for i in range(1, len(ch2)):
+            cur = abs(ch2[i]) > threshold
+            if cur and not prev:
+                out[n] = i
+                n += 1
+            prev = cur
+        return out[:n]
+else:
+    _find_trigger_indices = None
+
+def _find_trigger_indices_packed(above):
+    """Rising edges on 8-samples-per-byte packed words, for huge traces.
+
+    Packing the above-threshold mask turns the edge detect into byte-wide
+    shift/and ops, an 8x cut in the bytes the comparison pass touches.
+    """
+    packed = np.packbits(above)
+
+    # Carry each byte's LSB into its neighbour so edges crossing byte
+    # boundaries survive; seed sample 0 with itself so it can't be an edge
+    carry = np.empty_like(packed)
+    carry[0] = 1 if above[0] else 0
+    carry[1:] = packed[:-1] & 1
+
+    prev_packed = (packed >> 1) | (carry << 7)
+    rising = packed & ~prev_packed
+
+    return np.flatnonzero(np.unpackbits(rising, count=len(above)))
+
+# Schema DDL shipped with the app; a constant so every call returns the
+# same interned string
+_SCHEMA_DDL = """-- Oscilloscope Analysis Database Schema
+-- Run this in PostgreSQL to create the required tables
+
+-- One partitioned table replaces the five near-identical per-test-type
+-- tables; the partitions keep the old table names so existing queries
+-- (and direct partition scans) continue to work, while indexes and new
+-- columns are defined once on the parent.
+CREATE TABLE IF NOT EXISTS analysis_results (
+    id SERIAL,
+    test_type TEXT NOT NULL,
+    file_name VARCHAR(255) NOT NULL,
+    test_number VARCHAR(50) NOT NULL,
+    test_bench VARCHAR(100) NOT NULL,
+    tester_id VARCHAR(50) NOT NULL,
+    test_date DATE NOT NULL,
+    analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    dut_device VARCHAR(255),
+    reference_device VARCHAR(255),
+    skid_plate_diameter VARCHAR(50),
+    test_function VARCHAR(100),
+    peak_to_peak_mv DOUBLE PRECISION,
+    trigger_current_a DOUBLE PRECISION,
+    noise_mv DOUBLE PRECISION,
+    ringdown_voltage_mv DOUBLE PRECISION,
+    frequency_khz DOUBLE PRECISION,
+    data_points INTEGER,
+    sample_rate_khz DOUBLE PRECISION,
+    peak_to_peak_lsl DOUBLE PRECISION,
+    peak_to_peak_usl DOUBLE PRECISION,
+    trigger_current_lsl DOUBLE PRECISION,
+    trigger_current_usl DOUBLE PRECISION,
+    noise_lsl DOUBLE PRECISION,
+    noise_usl DOUBLE PRECISION,
+    ringdown_lsl DOUBLE PRECISION,
+    ringdown_usl DOUBLE PRECISION,
+    trigger_events INTEGER,
+    pass_fail VARCHAR(10),
+    PRIMARY KEY (id, test_type)
+) PARTITION BY LIST (test_type);
+
+CREATE TABLE IF NOT EXISTS dtt_analysis PARTITION OF analysis_results FOR VALUES IN ('DTT');
+CREATE TABLE IF NOT EXISTS dtr_analysis PARTITION OF analysis_results FOR VALUES IN ('DTR');
+CREATE TABLE IF NOT EXISTS dc02_analysis PARTITION OF analysis_results FOR VALUES IN ('DC02');
+CREATE TABLE IF NOT EXISTS dc03_skid_analysis PARTITION OF analysis_results FOR VALUES IN ('DC03 SKID');
+CREATE TABLE IF NOT EXISTS idod_analysis PARTITION OF analysis_results FOR VALUES IN ('IDOD');
+
+-- Indexes declared once on the parent propagate to every partition
+CREATE INDEX IF NOT EXISTS idx_analysis_results_test_date ON analysis_results(test_date);
+CREATE INDEX IF NOT EXISTS idx_analysis_results_passfail_date ON analysis_results(pass_fail, test_date DESC);
+CREATE INDEX IF NOT EXISTS idx_analysis_results_tester ON analysis_results(tester_id);
+CREATE INDEX IF NOT EXISTS idx_analysis_results_test_number ON analysis_results(test_number);
+CREATE INDEX IF NOT EXISTS idx_analysis_results_bench ON analysis_results(test_bench);
+CREATE INDEX IF NOT EXISTS idx_analysis_results_failures ON analysis_results(test_date DESC) WHERE pass_fail = 'fail';
+
+-- Trigram GIN indexes let the tester/bench substring filters (ILIKE '%...%')
+-- use an index instead of scanning every partition
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_analysis_results_tester_trgm ON analysis_results USING gin (tester_id gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_analysis_results_bench_trgm ON analysis_results USING gin (test_bench gin_trgm_ops);"""
+
+# Sample row kept out of the production DDL; appended only on request
+_SAMPLE_DATA_DML = """-- Insert sample data for testing
+INSERT INTO analysis_results (
+    test_type, file_name, test_number, test_bench, tester_id, test_date, test_function,
+    dut_device, reference_device, peak_to_peak_mv, trigger_current_a, noise_mv,
+    frequency_khz, data_points, sample_rate_khz, peak_to_peak_lsl, peak_to_peak_usl,
+    trigger_current_lsl, trigger_current_usl, noise_lsl, noise_usl, trigger_events, pass_fail
+) VALUES (
+    'DTT', 'sample_test.csv', 'T001', 'Bench A', 'admin', CURRENT_DATE, 'Performance test',
+    'DTT (SV/33053/0020) [DUT]', 'DTR (SV/33053/0031) [Reference]', 350.5, 55.2, 2.1,
+    250.0, 2000, 250.0, 150, 400, 30, 80, 0, 5, 3, 'pass'
+);
+"""
+
+def _native_value(value):
+    """psycopg2 can't adapt numpy scalars; unwrap them at the DB boundary"""
+    return value.item() if isinstance(value, np.generic) else value
+
+# Analysis tables and their display labels, precomputed once instead of
+# rebuilt with string ops on every query
+_TABLES = [
+    ('dtt_analysis', 'DTT'),
+    ('dtr_analysis', 'DTR'),
+    ('dc02_analysis', 'DC02'),
+    ('dc03_skid_analysis', 'DC03 SKID'),
+    ('idod_analysis', 'IDOD')
+]
+
+class DatabaseManager:
+    def __init__(self):
+        self.connection_params = {
+            'host': 'localhost',
+            'database': 'oscilloscope_db',
+            'user': 'oscuser',
+            'password': 'oscpassword123',
+            'port': '5432'
+        }
+        self._pool = None
+        self._cache_version = 0
+        self._result_cache = {}
+        self._insert_sql_cache = {}
+
+    # Saves from this process bump _cache_version, but other writers can't,
+    # so entries also age out after a short TTL
+    CACHE_TTL_S = 30.0
+
+    def _cache_key(self, name, filters):
+        filter_key = tuple(sorted(filters.items())) if filters else ()
+        return (name, self._cache_version, filter_key)
+
+    def _cache_get(self, key):
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+
+        timestamp, value = entry
+        if time.monotonic() - timestamp > self.CACHE_TTL_S:
+            del self._result_cache[key]
+            return None
+        return value
+
+    def _cache_put(self, key, value):
+        if len(self._result_cache) >= 32:
+            self._result_cache.pop(next(iter(self._result_cache)))
+        self._result_cache[key] = (time.monotonic(), value)
+
+    def connect(self):
+        try:
+            return psycopg2.connect(**self.connection_params)
+        except Exception as e:
+            print(f"Database connection error: {e}")
+            return None
+
+    def close_pool(self):
+        """Drop the pool so the next query reconnects with fresh parameters"""
+        if self._pool is not None:
+            try:
+                self._pool.closeall()
+            except Exception:
+                pass
+            self._pool = None
+
+    @contextmanager
+    def _conn(self):
+        """Check a connection out of the shared pool for the duration of one query"""
+        if self._pool is None:
+            try:
+                self._pool = psycopg2.pool.ThreadedConnectionPool(1, 8, **self.connection_params)
+            except Exception as e:
+                print(f"Database connection error: {e}")
+                yield None
+                return
+
+        try:
+            conn = self._pool.getconn()
+        except Exception as e:
+            print(f"Database connection error: {e}")
+            yield None
+            return
+
+        try:
+            yield conn
+        finally:
+            try:
+                conn.rollback()  # leave no open transaction on the pooled connection
+            except Exception:
+                pass
+            self._pool.putconn(conn)
+
+    def save_analysis(self, test_type, data):
+        return self.save_analyses(test_type, [data])
+
+    def save_analyses(self, test_type, rows):
+        """Insert a batch of analysis rows with one round-trip per 500 rows"""
+        if not rows:
+            return True
+
+        # The partition key must accompany every row; the label matches the
+        # partition list values ('DTT', 'DC03 SKID', ...)
+        rows = [{**row, 'test_type': test_type.upper()} for row in rows]
+
+        with self._conn() as conn:
+            if not conn:
+                return False
+
+            try:
+                cursor = conn.cursor()
+                table_name = f"{test_type.lower().replace(' ', '_')}_analysis"
+                columns = tuple(rows[0].keys())
+
+                # Compose and validate each distinct insert statement once
+                query = self._insert_sql_cache.get((table_name, columns))
+                if query is None:
+                    if not table_name.isidentifier() or not all(c.isidentifier() for c in columns):
+                        raise ValueError(f"Invalid identifier in {table_name} insert")
+
+                    query = f"""
+                    INSERT INTO {table_name} ({', '.join(columns)})
+                    VALUES %s
+                    """
+                    self._insert_sql_cache[(table_name, columns)] = query
+
+                values = [[_native_value(row.get(column)) for column in columns] for row in rows]
+
+                psycopg2.extras.execute_values(cursor, query, values, page_size=500)
+                conn.commit()
+                self._cache_version += 1  # invalidate memoized query results
+                return True
+
+            except Exception as e:
+                print(f"Database save error: {e}")
+                return False
+
+    def get_results(self, test_type, limit=100, offset=0):
+        with self._conn() as conn:
+            if not conn:
+                return [], []
+
+            try:
+                cursor = conn.cursor()
+                table_name = f"{test_type.lower().replace(' ', '_')}_analysis"
+
+                cursor.execute(f"""
+                    SELECT * FROM {table_name}
+                    ORDER BY analysis_date DESC
+                    LIMIT %s OFFSET %s
+                """, (limit, offset))
+
+                # Tuples go straight from the driver into the table model;
+                # no per-row dict rebuild
+                headers = [desc[0] for desc in cursor.description]
+                return headers, cursor.fetchall()
+
+            except Exception as e:
+                print(f"Database query error: {e}")
+                return [], []
+    
+    def get_all_results(self, filters=None, limit=None, offset=0):
+        """Get results from all tables with optional filters"""
+        key = self._cache_key(('all_results', limit, offset), filters)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        with self._conn() as conn:
+            results = self._query_all_results(conn, filters, limit, offset)
+
+        if results:
+            self._cache_put(key, results)
+        return results
+
+    def _table_queries(self, cursor, filters=None, include_source=True):
+        """Build the filtered per-table SELECTs as (table, test_type, query, params)"""
+        # One round-trip for table existence instead of one per table
+        cursor.execute("""
+            SELECT table_name FROM information_schema.tables
+            WHERE table_name = ANY(%s)
+        """, ([table for table, _ in _TABLES],))
+        existing = {row[0] for row in cursor.fetchall()}
+
+        queries = []
+        for table, test_type in _TABLES:
+            if table not in existing:
+                continue
+
+            # Build query with filters; exports skip the bookkeeping column
+            # entirely instead of stripping it per row
+            if include_source:
+                query = f"SELECT *, '{table}' as source_table FROM {table}"
+            else:
+                query = f"SELECT * FROM {table}"
+            where_conditions = []
+            params = []
+
+            if filters:
+                if filters.get('test_type') and filters['test_type'] != 'All':
+                    if test_type != filters['test_type'].upper():
+                        continue
+
+                if filters.get('pass_fail') and filters['pass_fail'] != 'All':
+                    where_conditions.append("pass_fail = %s")
+                    params.append(filters['pass_fail'].lower())
+
+                if filters.get('tester_id'):
+                    where_conditions.append("tester_id ILIKE %s")
+                    params.append(f"%{filters['tester_id']}%")
+
+                if filters.get('test_bench'):
+                    where_conditions.append("test_bench ILIKE %s")
+                    params.append(f"%{filters['test_bench']}%")
+
+                if filters.get('date_from'):
+                    where_conditions.append("test_date >= %s")
+                    params.append(filters['date_from'])
+
+                if filters.get('date_to'):
+                    # Half-open range keeps the bare column index-friendly
+                    where_conditions.append("test_date < %s")
+                    params.append(filters['date_to'] + timedelta(days=1))
+
+            if where_conditions:
+                query += " WHERE " + " AND ".join(where_conditions)
+
+            query += " ORDER BY analysis_date DESC"
+            queries.append((table, test_type, query, params))
+
+        return queries
+
+    def _query_all_results(self, conn, filters=None, limit=None, offset=0):
+        if not conn:
+            return []
+
+        all_results = []
+
+        try:
+            cursor = conn.cursor()
+
+            for table, test_type, query, params in self._table_queries(cursor, filters):
+                if limit is not None:
+                    # The tables have differing columns, so the page is merged
+                    # client-side; the top offset+limit rows per table are a
+                    # guaranteed superset of the global page
+                    query += " LIMIT %s"
+                    params = params + [offset + limit]
+
+                # Named cursor streams rows server-side; RealDictCursor builds
+                # the dicts in C instead of a zip per row
+                with conn.cursor(name=f'all_results_{table}',
+                                 cursor_factory=psycopg2.extras.RealDictCursor) as table_cursor:
+                    table_cursor.itersize = 10000
+                    table_cursor.execute(query, params)
+
+                    for row in table_cursor:
+                        row['test_type'] = test_type
+                        all_results.append(row)
+
+            if limit is not None:
+                all_results.sort(
+                    key=lambda r: (r.get('analysis_date') is not None, r.get('analysis_date')),
+                    reverse=True
+                )
+                all_results = all_results[offset:offset + limit]
+
+            return all_results
+
+        except Exception as e:
+            print(f"Database query error: {e}")
+            return []
+
+    def copy_results_to(self, file_obj, filters=None):
+        """Splice filtered rows into a CSV file via COPY; no per-row Python cost.
+
+        Returns the number of rows written, or None when COPY isn't possible
+        (caller falls back to the streaming writer).
+        """
+        with self._conn() as conn:
+            if not conn:
+                return None
+
+            try:
+                cursor = conn.cursor()
+
+                # Concatenated COPY output needs every partition to share one
+                # column set; pre-partition schemas don't, so they take the
+                # DictWriter fallback instead
+                cursor.execute("""
+                    SELECT EXISTS (
+                        SELECT FROM information_schema.tables
+                        WHERE table_name = 'analysis_results'
+                    )
+                """)
+                if not cursor.fetchone()[0]:
+                    return None
+
+                queries = self._table_queries(cursor, filters, include_source=False)
+                if not queries:
+                    return 0
+
+                copied = 0
+                for i, (table, test_type, query, params) in enumerate(queries):
+                    # COPY takes no bind parameters, so inline them safely
+                    inlined = cursor.mogrify(query, params).decode()
+                    header = " HEADER" if i == 0 else ""
+                    cursor.copy_expert(f"COPY ({inlined}) TO STDOUT WITH CSV{header}", file_obj)
+                    copied += max(cursor.rowcount, 0)
+
+                return copied
+
+            except Exception as e:
+                print(f"Database export error: {e}")
+                return None
+
+    def iter_results(self, filters=None, batch=1000):
+        """Yield result rows one at a time without materializing the full set"""
+        with self._conn() as conn:
+            if not conn:
+                return
+
+            try:
+                cursor = conn.cursor()
+
+                for table, test_type, query, params in self._table_queries(cursor, filters,
+                                                                           include_source=False):
+                    with conn.cursor(name=f'iter_results_{table}',
+                                     cursor_factory=psycopg2.extras.RealDictCursor) as table_cursor:
+                        table_cursor.itersize = batch
+                        table_cursor.execute(query, params)
+
+                        for row in table_cursor:
+                            row['test_type'] = test_type
+                            yield row
+
+            except Exception as e:
+                print(f"Database query error: {e}")
+
+    def get_analytics_summary_sql(self, filters=None):
+        """Compute summary statistics with SQL aggregates so only O(groups) rows leave the DB"""
+        with self._conn() as conn:
+            return self._query_analytics_summary(conn, filters)
+
+    def _query_analytics_summary(self, conn, filters=None):
+        if not conn:
+            return None
+
+        try:
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT table_name FROM information_schema.tables
+                WHERE table_name = ANY(%s)
+            """, ([table for table, _ in _TABLES],))
+            existing = {row[0] for row in cursor.fetchall()}
+
+            where_conditions = []
+            params = []
+
+            if filters:
+                if filters.get('pass_fail') and filters['pass_fail'] != 'All':
+                    where_conditions.append("pass_fail = %s")
+                    params.append(filters['pass_fail'].lower())
+
+                if filters.get('tester_id'):
+                    where_conditions.append("tester_id ILIKE %s")
+                    params.append(f"%{filters['tester_id']}%")
+
+                if filters.get('test_bench'):
+                    where_conditions.append("test_bench ILIKE %s")
+                    params.append(f"%{filters['test_bench']}%")
+
+                if filters.get('date_from'):
+                    where_conditions.append("test_date >= %s")
+                    params.append(filters['date_from'])
+
+                if filters.get('date_to'):
+                    # Half-open range keeps the bare column index-friendly
+                    where_conditions.append("test_date < %s")
+                    params.append(filters['date_to'] + timedelta(days=1))
+
+            where_sql = (" WHERE " + " AND ".join(where_conditions)) if where_conditions else ""
+
+            selects = []
+            union_params = []
+            for table, test_type in _TABLES:
+                if table not in existing:
+                    continue
+
+                if filters and filters.get('test_type') and filters['test_type'] != 'All':
+                    if test_type != filters['test_type'].upper():
+                        continue
+
+                selects.append(f"""
+                    SELECT '{test_type}' AS test_type, tester_id, test_bench, test_date,
+                           pass_fail, peak_to_peak_mv, trigger_current_a, noise_mv
+                    FROM {table}{where_sql}
+                """)
+                union_params.extend(params)
+
+            if not selects:
+                return {}
+
+            view_sql = " UNION ALL ".join(selects)
+            recent_date = datetime.now().date() - timedelta(days=30)
+
+            # NULLIF drops zero-valued placeholders from the parameter stats,
+            # matching the truthiness filter both Python fallbacks apply
+            cursor.execute(f"""
+                SELECT COUNT(*),
+                       COUNT(*) FILTER (WHERE pass_fail = 'pass'),
+                       COUNT(*) FILTER (WHERE test_date >= %s),
+                       COUNT(*) FILTER (WHERE test_date >= %s AND pass_fail = 'pass'),
+                       AVG(NULLIF(peak_to_peak_mv, 0)), STDDEV_POP(NULLIF(peak_to_peak_mv, 0)),
+                       MIN(NULLIF(peak_to_peak_mv, 0)), MAX(NULLIF(peak_to_peak_mv, 0)),
+                       AVG(NULLIF(trigger_current_a, 0)), STDDEV_POP(NULLIF(trigger_current_a, 0)),
+                       MIN(NULLIF(trigger_current_a, 0)), MAX(NULLIF(trigger_current_a, 0)),
+                       AVG(NULLIF(noise_mv, 0)), STDDEV_POP(NULLIF(noise_mv, 0)),
+                       MIN(NULLIF(noise_mv, 0)), MAX(NULLIF(noise_mv, 0))
+                FROM ({view_sql}) v
+            """, [recent_date, recent_date] + union_params)
+
+            totals = cursor.fetchone()
+            total_tests = totals[0]
+            if total_tests == 0:
+                return {}
+
+            pass_count = totals[1]
+            recent_tests = totals[2]
+            recent_pass = totals[3]
+
+            def parameter_stats(stats_row):
+                mean, std, min_value, max_value = stats_row
+                return {
+                    'mean': float(mean or 0),
+                    'std': float(std or 0),
+                    'min': float(min_value or 0),
+                    'max': float(max_value or 0)
+                }
+
+            # One GROUPING SETS query delivers all three breakdowns; the
+            # GROUPING bitmask says which dimension each row belongs to
+            cursor.execute(f"""
+                SELECT GROUPING(test_type, tester_id, test_bench),
+                       COALESCE(test_type, tester_id, test_bench, 'Unknown'),
+                       COUNT(*),
+                       COUNT(*) FILTER (WHERE pass_fail = 'pass')
+                FROM ({view_sql}) v
+                GROUP BY GROUPING SETS ((test_type), (tester_id), (test_bench))
+            """, union_params)
+
+            breakdowns = {'test_types': {}, 'testers': {}, 'test_benches': {}}
+            dimension_keys = {3: 'test_types', 5: 'testers', 6: 'test_benches'}
+            for dims, name, total, passed in cursor.fetchall():
+                breakdowns[dimension_keys[dims]][name] = {
+                    'total': total, 'pass': passed, 'fail': total - passed
+                }
+
+            return {
+                'summary': {
+                    'total_tests': total_tests,
+                    'pass_count': pass_count,
+                    'fail_count': total_tests - pass_count,
+                    'pass_rate': (pass_count / total_tests * 100) if total_tests > 0 else 0,
+                    'recent_pass_rate': (recent_pass / recent_tests * 100) if recent_tests else 0,
+                    'recent_tests': recent_tests
+                },
+                'test_types': breakdowns['test_types'],
+                'testers': breakdowns['testers'],
+                'test_benches': breakdowns['test_benches'],
+                'parameters': {
+                    'peak_to_peak': parameter_stats(totals[4:8]),
+                    'trigger_current': parameter_stats(totals[8:12]),
+                    'noise': parameter_stats(totals[12:16])
+                }
+            }
+
+        except Exception as e:
+            print(f"Database query error: {e}")
+            return None
+
+    def _summarize_results_pandas(self, results):
+        """Roll up a large result list with vectorized pandas groupbys"""
+        # Project only the columns the rollup reads; the other ~20 per row
+        # never become DataFrame blocks
+        df = pd.DataFrame(results, columns=[
+            'pass_fail', 'test_type', 'tester_id', 'test_bench', 'test_date',
+            'peak_to_peak_mv', 'trigger_current_a', 'noise_mv'
+        ])
+        total_tests = len(df)
+        passed = df['pass_fail'] == 'pass' if 'pass_fail' in df else pd.Series(False, index=df.index)
+        pass_count = int(passed.sum())
+
+        recent_date = datetime.now().date() - timedelta(days=30)
+        if 'test_date' in df:
+            recent_mask = df['test_date'].notna() & (df['test_date'] >= recent_date)
+        else:
+            recent_mask = pd.Series(False, index=df.index)
+        recent_tests = int(recent_mask.sum())
+        recent_pass = int((recent_mask & passed).sum())
+
+        def breakdown(column):
+            if column not in df:
+                return {}
+            grouped = passed.groupby(df[column].fillna('Unknown')).agg(['size', 'sum'])
+            return {
+                name: {'total': int(row['size']), 'pass': int(row['sum']),
+                       'fail': int(row['size'] - row['sum'])}
+                for name, row in grouped.iterrows()
+            }
+
+        def parameter_stats(column):
+            values = pd.to_numeric(df[column], errors='coerce').dropna() if column in df else pd.Series(dtype=float)
+            values = values[values != 0]  # match the truthiness filter of the loop path
+            if values.empty:
+                return {'mean': 0, 'std': 0, 'min': 0, 'max': 0}
+            return {
+                'mean': values.mean(),
+                'std': values.std(ddof=0),
+                'min': values.min(),
+                'max': values.max()
+            }
+
+        return {
+            'summary': {
+                'total_tests': total_tests,
+                'pass_count': pass_count,
+                'fail_count': total_tests - pass_count,
+                'pass_rate': (pass_count / total_tests * 100) if total_tests > 0 else 0,
+                'recent_pass_rate': (recent_pass / recent_tests * 100) if recent_tests else 0,
+                'recent_tests': recent_tests
+            },
+            'test_types': breakdown('test_type'),
+            'testers': breakdown('tester_id'),
+            'test_benches': breakdown('test_bench'),
+            'parameters': {
+                'peak_to_peak': parameter_stats('peak_to_peak_mv'),
+                'trigger_current': parameter_stats('trigger_current_a'),
+                'noise': parameter_stats('noise_mv')
+            }
+        }
+
+    def get_analytics_summary(self, filters=None):
+        """Get summary statistics for analytics"""
+        key = self._cache_key('analytics_summary', filters)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        summary = self.get_analytics_summary_sql(filters)
+        if summary is not None:
+            self._cache_put(key, summary)
+            return summary
+
+        # Fall back to the Python rollup when the DB can't aggregate
+        results = self.get_all_results(filters)
+        
+        if not results:
+            return {}
+
+        # Above ~1000 rows the C-level groupby wins; below it the DataFrame
+        # build costs more than the plain loop
+        if len(results) > 1000:
+            summary = self._summarize_results_pandas(results)
+            self._cache_put(key, summary)
+            return summary
+
+        def new_counts():
+            return {'total': 0, 'pass': 0, 'fail': 0}
+
+        test_types = defaultdict(new_counts)
+        testers = defaultdict(new_counts)
+        test_benches = defaultdict(new_counts)
+
+        total_tests = len(results)
+        pass_count = 0
+
+        recent_date = datetime.now().date() - timedelta(days=30)
+        recent_tests = 0
+        recent_pass = 0
+
+        peak_to_peak_values = array('d')
+        trigger_current_values = array('d')
+        noise_values = array('d')
+
+        # Single pass over the results instead of one scan per statistic
+        for result in results:
+            passed = result.get('pass_fail') == 'pass'
+            if passed:
+                pass_count += 1
+
+            for counts in (test_types[result.get('test_type', 'Unknown')],
+                           testers[result.get('tester_id', 'Unknown')],
+                           test_benches[result.get('test_bench', 'Unknown')]):
+                counts['total'] += 1
+                counts['pass' if passed else 'fail'] += 1
+
+            # Recent trends (last 30 days)
+            test_date = result.get('test_date')
+            if test_date and test_date >= recent_date:
+                recent_tests += 1
+                if passed:
+                    recent_pass += 1
+
+            if result.get('peak_to_peak_mv'):
+                peak_to_peak_values.append(float(result['peak_to_peak_mv']))
+            if result.get('trigger_current_a'):
+                trigger_current_values.append(float(result['trigger_current_a']))
+            if result.get('noise_mv'):
+                noise_values.append(float(result['noise_mv']))
+
+        pass_rate = (pass_count / total_tests * 100) if total_tests > 0 else 0
+        recent_pass_rate = (recent_pass / recent_tests * 100) if recent_tests else 0
+
+        def parameter_stats(buffer):
+            if not buffer:
+                return {'mean': 0, 'std': 0, 'min': 0, 'max': 0}
+            values = np.frombuffer(buffer, dtype=np.float64)
+            return {
+                'mean': values.mean(),
+                'std': values.std(),
+                'min': values.min(),
+                'max': values.max()
+            }
+
+        summary = {
+            'summary': {
+                'total_tests': total_tests,
+                'pass_count': pass_count,
+                'fail_count': total_tests - pass_count,
+                'pass_rate': pass_rate,
+                'recent_pass_rate': recent_pass_rate,
+                'recent_tests': recent_tests
+            },
+            'test_types': dict(test_types),
+            'testers': dict(testers),
+            'test_benches': dict(test_benches),
+            'parameters': {
+                'peak_to_peak': parameter_stats(peak_to_peak_values),
+                'trigger_current': parameter_stats(trigger_current_values),
+                'noise': parameter_stats(noise_values)
+            }
+        }
+        self._cache_put(key, summary)
+        return summary
+
+def load_csv_data(file_path):
+    with open(file_path, 'rb') as file:
+        for line in file:
+            if b'TIME,CH1,CH2' in line:
+                break
+        else:
+            raise ValueError("Could not find data header in CSV file")
+
+        # The handle now sits just past the header, so pandas' C engine can
+        # parse the remainder straight into typed arrays without reopening
+        frame = pd.read_csv(file, header=None,
+                            usecols=[0, 1, 2], names=['time', 'ch1', 'ch2'],
+                            engine='c', on_bad_lines='skip')
+    frame = frame.apply(pd.to_numeric, errors='coerce').dropna()
+
+    # Scope samples carry 12-14 bits of real precision, so float32 halves the
+    # memory traffic of every reduction; the time base keeps float64
+    return {
+        'time': frame['time'].to_numpy(dtype=np.float64) * 1000,
+        'ch1': frame['ch1'].to_numpy(dtype=np.float32),
+        'ch2': frame['ch2'].to_numpy(dtype=np.float32)
+    }
+
+def calculate_analysis(data, trigger_threshold):
+    if not data or len(data['time']) == 0:
+        return {}
+
+    times = data['time']
+    ch1_values = data['ch1']
+    ch2_values = data['ch2']
+
+    # Plain float() at the payload boundary: float32 scalars don't adapt in
+    # psycopg2 and would fail every save
+    ch1_min, ch1_max = float(ch1_values.min()), float(ch1_values.max())
+    ch1_peak_to_peak = (ch1_max - ch1_min) * 1000
+
+    ch2_min, ch2_max = float(ch2_values.min()), float(ch2_values.max())
+    ch2_peak_to_peak = ch2_max - ch2_min
+
+    # float64 accumulators keep the float32 traces from losing precision
+    ch1_rms = float(np.sqrt(np.mean(ch1_values * ch1_values, dtype=np.float64)))
+    ch2_rms = float(np.sqrt(np.mean(ch2_values * ch2_values, dtype=np.float64)))
+
+    ch1_mean = float(ch1_values.mean(dtype=np.float64))
+    ch1_noise = float(ch1_values.std(dtype=np.float64)) * 1000
+    
+    if _find_trigger_indices is not None:
+        trigger_indices = _find_trigger_indices(ch2_values, trigger_threshold)
+    else:
+        # Rising-edge detection as two vector ops instead of a per-sample loop
+        above = np.abs(ch2_values) > trigger_threshold
+        if len(above) > (1 << 20):
+            trigger_indices = _find_trigger_indices_packed(above)
+        else:
+            trigger_indices = np.flatnonzero(above[1:] & ~above[:-1]) + 1
+
+    trigger_points = [
+        {'time': float(times[i]), 'index': int(i), 'current': float(ch2_values[i])}
+        for i in trigger_indices
+    ]
+    
+    ringdown = calculate_ringdown(ch1_values)
+    
+    # Scope time bases are monotonic, so the endpoints are the extremes
+    time_start, time_end = float(times[0]), float(times[-1])
+    duration = time_end - time_start
+    sample_rate = len(times) / (duration / 1000) if duration > 0 else 0
+    
+    return {
+        # SoA payload: three contiguous arrays, not one dict per sample
+        'raw_data': data,
+        'ch1': {
+            'min': ch1_min,
+            'max': ch1_max,
+            'peak_to_peak': ch1_peak_to_peak,
+            'rms': ch1_rms,
+            'noise': ch1_noise,
+            'ringdown': ringdown
+        },
+        'ch2': {
+            'min': ch2_min,
+            'max': ch2_max,
+            'peak_to_peak': ch2_peak_to_peak,
+            'rms': ch2_rms
+        },
+        'trigger': {
+            'threshold': trigger_threshold,
+            'points': trigger_points,
+            'count': len(trigger_points)
+        },
+        'metadata': {
+            'data_points': len(times),
+            'sample_rate': sample_rate,
+            'duration': duration,
+            'time_start': time_start,
+            'time_end': time_end
+        }
+    }
+
+def calculate_ringdown(values):
+    if len(values) < 50:
+        return {'ringdown_voltage': 0, 'decay_constant': 0}
+    
+    abs_values = np.abs(values)
+    max_idx = int(np.argmax(abs_values))
+
+    if max_idx >= len(values) - 20:
+        return {'ringdown_voltage': 0, 'decay_constant': 0}
+
+    segment_end = min(max_idx + 100, len(values))
+    segment_length = segment_end - max_idx
+    initial_amp = float(abs_values[max_idx])
+    final_amp = float(abs_values[segment_end - 1])
+
+    ringdown_voltage = (initial_amp - final_amp) * 1000
+
+    return {
+        'ringdown_voltage': ringdown_voltage,
+        'decay_constant': float(np.log(initial_amp / final_amp)) / segment_length if initial_amp > final_amp > 0 else 0
+    }
+
+def analyze_csv_file(file_path, trigger_current):
+    """Load and analyze one capture; safe to run in a worker process"""
+    return calculate_analysis(load_csv_data(file_path), trigger_current)
+
+class AnalysisWorker(QThread):
+    finished = pyqtSignal(dict)
+    progress = pyqtSignal(int)
+
+    def __init__(self, file_path, trigger_current):
+        super().__init__()
+        self.file_path = file_path
+        self.trigger_current = trigger_current
+
+    def run(self):
+        try:
+            self.progress.emit(10)
+            data = load_csv_data(self.file_path)
+
+            self.progress.emit(30)
+            analysis = calculate_analysis(data, self.trigger_current)
+
+            self.progress.emit(100)
+            self.finished.emit(analysis)
+
+        except Exception as e:
+            print(f"Analysis error: {e}")
+            self.finished.emit({})
+
+class BatchAnalysisWorker(QThread):
+    """Analyze several captures in parallel, one process per core"""
+    finished = pyqtSignal(dict)
+    progress = pyqtSignal(int)
+
+    def __init__(self, file_paths, trigger_current):
+        super().__init__()
+        self.file_paths = file_paths
+        self.trigger_current = trigger_current
+
+    def run(self):
+        analyses = {}
+        if not self.file_paths:
+            self.finished.emit(analyses)
+            return
+
+        try:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {
+                    executor.submit(analyze_csv_file, file_path, self.trigger_current): file_path
+                    for file_path in self.file_paths
+                }
+
+                done = 0
+                for future in as_completed(futures):
+                    file_path = futures[future]
+                    try:
+                        analyses[file_path] = future.result()
+                    except Exception as e:
+                        print(f"Analysis error: {e}")
+                        analyses[file_path] = {}
+
+                    done += 1
+                    self.progress.emit(int(done / len(futures) * 100))
+
+        except Exception as e:
+            print(f"Batch analysis error: {e}")
+
+        self.finished.emit(analyses)
+
+class MatplotlibWidget(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.figure = Figure(figsize=(10, 6))
+        self.canvas = FigureCanvas(self.figure)
+
+        # Waveform artists are created once and updated via set_data so a
+        # redraw never rebuilds the matplotlib artist tree
+        self.wave_axes_ready = False
+        self.trigger_vlines = []
+        self.analytics_hash = None
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.canvas)
+        self.setLayout(layout)
+
+    def setup_wave_axes(self):
+        self.figure.clear()
+
+        self.ax1 = self.figure.add_subplot(211)
+        self.ax2 = self.figure.add_subplot(212)
+
+        self.line_ch1, = self.ax1.plot([], [], 'g-', linewidth=1, label='CH1 (Voltage)')
+        self.ax1.set_ylabel('Voltage (V)')
+        self.ax1.set_title('Channel 1 - Voltage')
+        self.ax1.grid(True, alpha=0.3)
+        self.ax1.legend()
+
+        self.line_ch2, = self.ax2.plot([], [], 'b-', linewidth=1, label='CH2 (Current)')
+        self.trigger_pos_line = self.ax2.axhline(y=0, color='r', linestyle='--', alpha=0.7)
+        self.trigger_neg_line = self.ax2.axhline(y=0, color='r', linestyle='--', alpha=0.7)
+        self.ax2.set_xlabel('Time (ms)')
+        self.ax2.set_ylabel('Current (A)')
+        self.ax2.set_title('Channel 2 - Current')
+        self.ax2.grid(True, alpha=0.3)
+
+        self.figure.tight_layout()
+        self.trigger_vlines = []
+        self.analytics_hash = None
+        self.wave_axes_ready = True
+
+    def plot_data(self, analysis_data, trigger_current, zoom_range=(0, 100)):
+        if not analysis_data or 'raw_data' not in analysis_data:
+            self.figure.clear()
+            self.wave_axes_ready = False
+            self.canvas.draw_idle()
+            return
+
+        data = analysis_data['raw_data']
+        times = data['time']
+        ch1_values = data['ch1']
+        ch2_values = data['ch2']
+
+        if len(times) == 0:
+            self.figure.clear()
+            self.wave_axes_ready = False
+            self.canvas.draw_idle()
+            return
+
+        if not self.wave_axes_ready:
+            self.setup_wave_axes()
+
+        start_idx = int(len(times) * zoom_range[0] / 100)
+        end_idx = int(len(times) * zoom_range[1] / 100)
+
+        plot_times = times[start_idx:end_idx]
+        plot_ch1 = ch1_values[start_idx:end_idx]
+        plot_ch2 = ch2_values[start_idx:end_idx]
+
+        # Downsample to ~2x the canvas pixel width; plotting more points
+        # than the screen can show only slows rasterization
+        max_points = max(2 * (self.canvas.width() or 1000), 2000)
+        if len(plot_times) > max_points:
+            step = len(plot_times) // max_points + 1
+            plot_times = plot_times[::step]
+            plot_ch1 = plot_ch1[::step]
+            plot_ch2 = plot_ch2[::step]
+
+        self.line_ch1.set_data(plot_times, plot_ch1)
+        self.line_ch2.set_data(plot_times, plot_ch2)
+
+        self.trigger_pos_line.set_ydata([trigger_current, trigger_current])
+        self.trigger_pos_line.set_label(f'Trigger +{trigger_current}A')
+        self.trigger_neg_line.set_ydata([-trigger_current, -trigger_current])
+        self.trigger_neg_line.set_label(f'Trigger -{trigger_current}A')
+        self.ax2.legend()
+
+        for vline in self.trigger_vlines:
+            vline.remove()
+        self.trigger_vlines = []
+
+        trigger_points = analysis_data.get('trigger', {}).get('points', [])
+        for point in trigger_points:
+            if start_idx <= point['index'] < end_idx:
+                self.trigger_vlines.append(
+                    self.ax2.axvline(x=point['time'], color='orange', linestyle=':', alpha=0.8)
+                )
+
+        self.ax1.relim()
+        self.ax1.autoscale_view()
+        self.ax2.relim()
+        self.ax2.autoscale_view()
+
+        self.canvas.draw_idle()
+    
+    def plot_analytics_charts(self, summary_data):
+        if not summary_data:
+            self.figure.clear()
+            self.wave_axes_ready = False
+            self.analytics_hash = None
+            self.canvas.draw()
+            return
+
+        # Redrawing four subplots is expensive; skip it when nothing changed
+        def freeze(mapping):
+            return tuple(sorted(
+                (key, tuple(sorted(value.items())) if isinstance(value, dict) else value)
+                for key, value in mapping.items()
+            ))
+
+        data_hash = hash((
+            freeze(summary_data.get('summary', {})),
+            freeze(summary_data.get('test_types', {})),
+            freeze(summary_data.get('testers', {})),
+            freeze(summary_data.get('parameters', {}))
+        ))
+        if data_hash == self.analytics_hash:
+            return
+        self.analytics_hash = data_hash
+
+        self.figure.clear()
+        self.wave_axes_ready = False
+        
+        ax1 = self.figure.add_subplot(221)
+        ax2 = self.figure.add_subplot(222)
+        ax3 = self.figure.add_subplot(223)
+        ax4 = self.figure.add_subplot(224)
+        
+        summary = summary_data.get('summary', {})
+        if summary.get('total_tests', 0) > 0:
+            labels = ['Pass', 'Fail']
+            sizes = [summary.get('pass_count', 0), summary.get('fail_count', 0)]
+            colors = ['#4CAF50', '#F44336']
+            ax1.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%', startangle=90)
+            ax1.set_title(f'Overall Results\n({summary.get("total_tests", 0)} tests)')
+        
+        test_types = summary_data.get('test_types', {})
+        if test_types:
+            types = list(test_types.keys())
+            pass_rates = [test_types[t]['pass'] / test_types[t]['total'] * 100 if test_types[t]['total'] > 0 else 0 for t in types]
+            
+            bars = ax2.bar(types, pass_rates, color='#2196F3', alpha=0.7)
+            ax2.set_title('Pass Rate by Test Type')
+            ax2.set_ylabel('Pass Rate (%)')
+            ax2.set_ylim(0, 100)
+            
+            for bar, rate in zip(bars, pass_rates):
+                ax2.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
+                        f'{rate:.1f}%', ha='center', va='bottom')
+        
+        parameters = summary_data.get('parameters', {})
+        peak_to_peak = parameters.get('peak_to_peak', {})
+        if peak_to_peak.get('mean', 0) > 0 and peak_to_peak.get('std', 0) > 0:
+            mean = peak_to_peak['mean']
+            std = peak_to_peak['std']
+            x = np.linspace(max(0, mean - 3*std), mean + 3*std, 100)
+            y = (1/(std * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x - mean) / std) ** 2)
+            ax3.plot(x, y, 'g-', linewidth=2)
+            ax3.axvline(mean, color='r', linestyle='--', alpha=0.7, label=f'Mean: {mean:.1f}mV')
+            ax3.set_title('Peak-to-Peak Distribution')
+            ax3.set_xlabel('Peak-to-Peak (mV)')
+            ax3.set_ylabel('Probability Density')
+            ax3.legend()
+        
+        testers = summary_data.get('testers', {})
+        if testers:
+            tester_names = list(testers.keys())
+            tester_pass_rates = [testers[t]['pass'] / testers[t]['total'] * 100 if testers[t]['total'] > 0 else 0 for t in tester_names]
+            
+            bars = ax4.barh(tester_names, tester_pass_rates, color='#FF9800', alpha=0.7)
+            ax4.set_title('Pass Rate by Tester')
+            ax4.set_xlabel('Pass Rate (%)')
+            ax4.set_xlim(0, 100)
+            
+            for bar, rate in zip(bars, tester_pass_rates):
+                ax4.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2,
+                        f'{rate:.1f}%', ha='left', va='center')
+        
+        self.figure.tight_layout()
+        self.canvas.draw()
+
+class ExportWorker(QThread):
+    """Stream filtered results to a CSV file off the GUI thread"""
+    finished = pyqtSignal(int, str)
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int)
+
+    def __init__(self, db_manager, file_path, filters=None):
+        super().__init__()
+        self.db_manager = db_manager
+        self.file_path = file_path
+        self.filters = filters
+
+    def run(self):
+        try:
+            # Fast path: Postgres serializes the CSV itself and the bytes are
+            # spliced straight into the file
+            with open(self.file_path, 'wb', buffering=1 << 20) as f:
+                copied = self.db_manager.copy_results_to(f, self.filters)
+
+            if copied is not None:
+                self.finished.emit(copied, self.file_path)
+                return
+
+            written = 0
+            writer = None
+            buffer = []
+
+            with open(self.file_path, 'w', newline='', buffering=1 << 20) as f:
+                for row in self.db_manager.iter_results(self.filters):
+                    if writer is None:
+                        # source_table is already excluded server-side
+                        writer = csv.DictWriter(f, fieldnames=list(row.keys()), extrasaction='ignore')
+                        writer.writeheader()
+
+                    # Flush in 1000-row chunks; peak memory stays at one chunk
+                    buffer.append(row)
+                    written += 1
+                    if len(buffer) == 1000:
+                        writer.writerows(buffer)
+                        buffer.clear()
+                        self.progress.emit(written)
+
+                if buffer:
+                    writer.writerows(buffer)
+
+            self.finished.emit(written, self.file_path)
+
+        except Exception as e:
+            self.error.emit(str(e))
+
+class ResultsTableModel(QAbstractTableModel):
+    """Read-only model over flat row tuples; the view only asks for visible cells"""
+    def __init__(self, headers=None, rows=None, parent=None):
+        super().__init__(parent)
+        self.headers = headers or []
+        self.rows = rows or []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal
+                and section < len(self.headers)):
+            return self.headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            value = self.rows[index.row()][index.column()]
+            if isinstance(value, (int, float)):
+                # Hand Qt the native number: no str allocation per paint and
+                # numeric rather than lexicographic sorting
+                return value
+            return str(value)
+        return None
+
+class PyQtGraphWidget(QWidget):
+    """Waveform display on pyqtgraph; mirrors MatplotlibWidget.plot_data"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        pg.setConfigOptions(useOpenGL=True, antialias=False)
+
+        self.voltage_plot = pg.PlotWidget(title='Channel 1 - Voltage')
+        self.voltage_plot.setLabel('left', 'Voltage (V)')
+        self.voltage_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.voltage_curve = self.voltage_plot.plot(pen='g')
+
+        self.current_plot = pg.PlotWidget(title='Channel 2 - Current')
+        self.current_plot.setLabel('left', 'Current (A)')
+        self.current_plot.setLabel('bottom', 'Time (ms)')
+        self.current_plot.showGrid(x=True, y=True, alpha=0.3)
+        self.current_curve = self.current_plot.plot(pen='b')
+        self.current_plot.setXLink(self.voltage_plot)
+
+        trigger_pen = pg.mkPen('r', style=Qt.PenStyle.DashLine)
+        self.trigger_pos_line = pg.InfiniteLine(angle=0, pen=trigger_pen)
+        self.trigger_neg_line = pg.InfiniteLine(angle=0, pen=trigger_pen)
+        self.current_plot.addItem(self.trigger_pos_line)
+        self.current_plot.addItem(self.trigger_neg_line)
+        self.trigger_vlines = []
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.voltage_plot)
+        layout.addWidget(self.current_plot)
+        self.setLayout(layout)
+
+    def plot_data(self, analysis_data, trigger_current, zoom_range=(0, 100)):
+        if not analysis_data or 'raw_data' not in analysis_data:
+            self.voltage_curve.setData([], [])
+            self.current_curve.setData([], [])
+            return
+
+        data = analysis_data['raw_data']
+        times = data['time']
+        ch1_values = data['ch1']
+        ch2_values = data['ch2']
+
+        if len(times) == 0:
+            self.voltage_curve.setData([], [])
+            self.current_curve.setData([], [])
+            return
+
+        start_idx = int(len(times) * zoom_range[0] / 100)
+        end_idx = int(len(times) * zoom_range[1] / 100)
+
+        self.voltage_curve.setData(times[start_idx:end_idx], ch1_values[start_idx:end_idx])
+        self.current_curve.setData(times[start_idx:end_idx], ch2_values[start_idx:end_idx])
+
+        self.trigger_pos_line.setValue(trigger_current)
+        self.trigger_neg_line.setValue(-trigger_current)
+
+        for vline in self.trigger_vlines:
+            self.current_plot.removeItem(vline)
+        self.trigger_vlines = []
+
+        trigger_pen = pg.mkPen('orange', style=Qt.PenStyle.DotLine)
+        for point in analysis_data.get('trigger', {}).get('points', []):
+            if start_idx <= point['index'] < end_idx:
+                vline = pg.InfiniteLine(angle=90, pos=point['time'], pen=trigger_pen)
+                self.current_plot.addItem(vline)
+                self.trigger_vlines.append(vline)
+
+class OscilloscopeAnalyzer(QMainWindow):
+    RESULTS_PAGE_SIZE = 200
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Oscilloscope Test System - PyQt6")
+        self.setGeometry(100, 100, 1400, 1000)
+
+        self.db_manager = DatabaseManager()
+        self.current_analysis = None
+        self.loaded_files = []
+        self.results_page_offset = 0
+        self._pass_fail_analysis = None
+        self._pass_fail_key = None
+        self._pass_fail_result = None
+
+        # Coalesce rapid spinbox edits into one chart redraw
+        self.chart_timer = QTimer(self)
+        self.chart_timer.setSingleShot(True)
+        self.chart_timer.setInterval(200)
+        self.chart_timer.timeout.connect(self._do_update_chart)
+
+        # Auto-apply analytics filters once the user pauses typing
+        self.analytics_timer = QTimer(self)
+        self.analytics_timer.setSingleShot(True)
+        self.analytics_timer.setInterval(400)
+        self.analytics_timer.timeout.connect(self.update_analytics)
+        
+        self.test_type_configs = {
+            'DTT': {
+                'name': 'DTT',
+                'dut_label': 'DTT (SV/33053/0020) [DUT]',
+                'reference_label': 'DTR (SV/33053/0031) [Reference]',
+                'has_ringdown': False
+            },
+            'DTR': {
+                'name': 'DTR',
+                'dut_label': 'DTR (SV/33053/0031) [DUT]',
+                'reference_label': 'DTT (SV/33053/0020) [Reference]',
+                'has_ringdown': False
+            },
+            'DC02': {
+                'name': 'DC02',
+                'dut_label': 'DC02 Innerblock (SV/103003/0016) [DUT]',
+                'reference_label': 'DCbox (SV/102603/0033) [Reference]',
+                'has_ringdown': True
+            },
+            'DC03 Skid': {
+                'name': 'DC03 Skid',
+                'dut_label': 'DC03 Skid (SV/102503/0026) [DUT]',
+                'reference_label': 'DC03 Innerblock (SV/33053/0029) [Reference]',
+                'has_ringdown': False
+            },
+            'IDOD': {
+                'name': 'IDOD',
+                'dut_label': 'IDOD skid [DUT]',
+                'reference_label': 'IDOD Innerblock (SV/33053/0028) [Reference]',
+                'has_ringdown': False,
+                'has_skid_plate': True
+            }
+        }
+        
+        self.setup_ui()
+        self.setup_connections()
+        
+    def setup_ui(self):
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        main_layout = QVBoxLayout(central_widget)
+        
+        self.tabs = QTabWidget()
+        main_layout.addWidget(self.tabs)
+        
+        self.setup_analysis_tab()
+        self.setup_database_tab()
+        self.setup_analytics_tab()
+        self.setup_settings_tab()
+        
+    def setup_analysis_tab(self):
+        analysis_widget = QWidget()
+        layout = QVBoxLayout(analysis_widget)
+        
+        # File operations section
+        file_group = QGroupBox("File Operations")
+        file_layout = QHBoxLayout(file_group)
+        
+        self.load_file_btn = QPushButton("Load CSV File")
+        self.load_file_btn.setStyleSheet("QPushButton { background-color: #4CAF50; color: white; padding: 8px; }")
+        
+        self.file_label = QLabel("No file loaded")
+        self.file_label.setStyleSheet("QLabel { color: #666; }")
+        
+        file_layout.addWidget(self.load_file_btn)
+        file_layout.addWidget(self.file_label)
+        file_layout.addStretch()
+        
+        layout.addWidget(file_group)
+        
+        # Progress bar
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        
+        # Splitter for main content
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        layout.addWidget(splitter)
+        
+        # Left panel - Configuration and results
+        left_panel = QWidget()
+        left_layout = QVBoxLayout(left_panel)
+        
+        # Test configuration
+        config_group = QGroupBox("Test Configuration")
+        config_layout = QFormLayout(config_group)
+        
+        self.test_type_combo = QComboBox()
+        self.test_type_combo.addItems(list(self.test_type_configs.keys()))
+        config_layout.addRow("Test Type:", self.test_type_combo)
+        
+        self.test_number_edit = QLineEdit()
+        config_layout.addRow("Test Number*:", self.test_number_edit)
+        
+        self.test_bench_edit = QLineEdit()
+        config_layout.addRow("Test Bench*:", self.test_bench_edit)
+        
+        self.tester_id_edit = QLineEdit()
+        config_layout.addRow("Tester ID*:", self.tester_id_edit)
+        
+        self.test_function_combo = QComboBox()
+        self.test_function_combo.addItems([
+            'Leak test', 'Performance test', 'Calibration test',
+            'Endurance test', 'Temperature test', 'Vibration test', 'Pressure test'
+        ])
+        config_layout.addRow("Test Function:", self.test_function_combo)
+        
+        self.skid_plate_combo = QComboBox()
+        self.skid_plate_combo.addItems(['100mm', '150mm', '200mm', '250mm', '300mm'])
+        self.skid_plate_combo.setVisible(False)
+        self.skid_plate_label = QLabel("Skid Plate Diameter:")
+        self.skid_plate_label.setVisible(False)
+        config_layout.addRow(self.skid_plate_label, self.skid_plate_combo)
+        
+        left_layout.addWidget(config_group)
+        
+        # Analysis settings
+        settings_group = QGroupBox("Analysis Settings")
+        settings_layout = QFormLayout(settings_group)
+        
+        self.trigger_current_spin = QDoubleSpinBox()
+        self.trigger_current_spin.setRange(0.1, 100.0)
+        self.trigger_current_spin.setValue(1.0)
+        self.trigger_current_spin.setSuffix(" A")
+        settings_layout.addRow("Trigger Current:", self.trigger_current_spin)
+        
+        self.zoom_start_spin = QSpinBox()
+        self.zoom_start_spin.setRange(0, 99)
+        self.zoom_start_spin.setValue(0)
+        self.zoom_start_spin.setSuffix(" %")
+        settings_layout.addRow("Zoom Start:", self.zoom_start_spin)
+        
+        self.zoom_end_spin = QSpinBox()
+        self.zoom_end_spin.setRange(1, 100)
+        self.zoom_end_spin.setValue(100)
+        self.zoom_end_spin.setSuffix(" %")
+        settings_layout.addRow("Zoom End:", self.zoom_end_spin)
+        
+        left_layout.addWidget(settings_group)
+        
+        # Pass/Fail Criteria
+        criteria_group = QGroupBox("Pass/Fail Criteria")
+        criteria_layout = QFormLayout(criteria_group)
+        
+        # Peak to Peak
+        peak_layout = QHBoxLayout()
+        self.peak_lsl_spin = QDoubleSpinBox()
+        self.peak_lsl_spin.setRange(0, 10000)
+        self.peak_lsl_spin.setValue(150)
+        self.peak_lsl_spin.setSuffix(" mV")
+        self.peak_usl_spin = QDoubleSpinBox()
+        self.peak_usl_spin.setRange(0, 10000)
+        self.peak_usl_spin.setValue(400)
+        self.peak_usl_spin.setSuffix(" mV")
+        peak_layout.addWidget(QLabel("LSL:"))
+        peak_layout.addWidget(self.peak_lsl_spin)
+        peak_layout.addWidget(QLabel("USL:"))
+        peak_layout.addWidget(self.peak_usl_spin)
+        criteria_layout.addRow("Peak-to-Peak:", peak_layout)
+        
+        # Trigger Current
+        trigger_layout = QHBoxLayout()
+        self.trigger_lsl_spin = QDoubleSpinBox()
+        self.trigger_lsl_spin.setRange(0, 1000)
+        self.trigger_lsl_spin.setValue(30)
+        self.trigger_lsl_spin.setSuffix(" A")
+        self.trigger_usl_spin = QDoubleSpinBox()
+        self.trigger_usl_spin.setRange(0, 1000)
+        self.trigger_usl_spin.setValue(80)
+        self.trigger_usl_spin.setSuffix(" A")
+        trigger_layout.addWidget(QLabel("LSL:"))
+        trigger_layout.addWidget(self.trigger_lsl_spin)
+        trigger_layout.addWidget(QLabel("USL:"))
+        trigger_layout.addWidget(self.trigger_usl_spin)
+        criteria_layout.addRow("Trigger Current:", trigger_layout)
+        
+        # Noise
+        noise_layout = QHBoxLayout()
+        self.noise_lsl_spin = QDoubleSpinBox()
+        self.noise_lsl_spin.setRange(0, 1000)
+        self.noise_lsl_spin.setValue(0)
+        self.noise_lsl_spin.setSuffix(" mV")
+        self.noise_usl_spin = QDoubleSpinBox()
+        self.noise_usl_spin.setRange(0, 1000)
+        self.noise_usl_spin.setValue(5)
+        self.noise_usl_spin.setSuffix(" mV")
+        noise_layout.addWidget(QLabel("LSL:"))
+        noise_layout.addWidget(self.noise_lsl_spin)
+        noise_layout.addWidget(QLabel("USL:"))
+        noise_layout.addWidget(self.noise_usl_spin)
+        criteria_layout.addRow("Noise:", noise_layout)
+        
+        # Ringdown (for DC02)
+        ringdown_layout = QHBoxLayout()
+        self.ringdown_lsl_spin = QDoubleSpinBox()
+        self.ringdown_lsl_spin.setRange(0, 1000)
+        self.ringdown_lsl_spin.setValue(0)
+        self.ringdown_lsl_spin.setSuffix(" mV")
+        self.ringdown_usl_spin = QDoubleSpinBox()
+        self.ringdown_usl_spin.setRange(0, 1000)
+        self.ringdown_usl_spin.setValue(100)
+        self.ringdown_usl_spin.setSuffix(" mV")
+        ringdown_layout.addWidget(QLabel("LSL:"))
+        ringdown_layout.addWidget(self.ringdown_lsl_spin)
+        ringdown_layout.addWidget(QLabel("USL:"))
+        ringdown_layout.addWidget(self.ringdown_usl_spin)
+        self.ringdown_row = criteria_layout.addRow("Ringdown:", ringdown_layout)
+        
+        left_layout.addWidget(criteria_group)
+        
+        # Analysis results
+        results_group = QGroupBox("Analysis Results")
+        results_layout = QVBoxLayout(results_group)
+        
+        self.results_text = QTextEdit()
+        self.results_text.setMaximumHeight(200)
+        self.results_text.setReadOnly(True)
+        results_layout.addWidget(self.results_text)
+        
+        # Pass/Fail indicator
+        self.pass_fail_label = QLabel("Status: Not Analyzed")
+        self.pass_fail_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.pass_fail_label.setStyleSheet("QLabel { font-size: 16px; font-weight: bold; padding: 8px; }")
+        results_layout.addWidget(self.pass_fail_label)
+        
+        # Action buttons
+        button_layout = QHBoxLayout()
+        self.analyze_btn = QPushButton("Analyze")
+        self.analyze_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; padding: 8px; }")
+        self.analyze_btn.setEnabled(False)  # Disabled until file is loaded
+        
+        self.save_btn = QPushButton("Save to Database")
+        self.save_btn.setStyleSheet("QPushButton { background-color: #FF9800; color: white; padding: 8px; }")
+        self.save_btn.setEnabled(False)
+        
+        button_layout.addWidget(self.analyze_btn)
+        button_layout.addWidget(self.save_btn)
+        results_layout.addLayout(button_layout)
+        
+        left_layout.addWidget(results_group)
+        left_layout.addStretch()
+        
+        # Right panel - Chart
+        right_panel = QWidget()
+        right_layout = QVBoxLayout(right_panel)
+        right_layout.addWidget(QLabel("Waveform Analysis"))
+
+        # Chart widgets are built on first use; constructing figures and font
+        # caches at startup is the slowest part of the import chain
+        self.chart_widget = None
+        self.chart_layout = right_layout
+        
+        # Set splitter proportions
+        splitter.addWidget(left_panel)
+        splitter.addWidget(right_panel)
+        splitter.setSizes([400, 800])
+        
+        self.tabs.addTab(analysis_widget, "Analysis")
+        
+    def setup_database_tab(self):
+        db_widget = QWidget()
+        layout = QVBoxLayout(db_widget)
+        
+        # Database connection info
+        conn_group = QGroupBox("Database Connection")
+        conn_layout = QFormLayout(conn_group)
+        
+        self.db_host_edit = QLineEdit("localhost")
+        conn_layout.addRow("Host:", self.db_host_edit)
+        
+        self.db_port_edit = QLineEdit("5432")
+        conn_layout.addRow("Port:", self.db_port_edit)
+        
+        self.db_name_edit = QLineEdit("oscilloscope_db")
+        conn_layout.addRow("Database:", self.db_name_edit)
+        
+        self.db_user_edit = QLineEdit("oscuser")
+        conn_layout.addRow("Username:", self.db_user_edit)
+        
+        self.db_password_edit = QLineEdit("oscpassword123")
+        self.db_password_edit.setEchoMode(QLineEdit.EchoMode.Password)
+        conn_layout.addRow("Password:", self.db_password_edit)
+        
+        self.test_connection_btn = QPushButton("Test Connection")
+        conn_layout.addRow("", self.test_connection_btn)
+        
+        layout.addWidget(conn_group)
+        
+        # Results table
+        results_group = QGroupBox("Saved Results")
+        results_layout = QVBoxLayout(results_group)
+        
+        # Filter controls
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("Test Type:"))
+        self.filter_combo = QComboBox()
+        self.filter_combo.addItems(['All'] + list(self.test_type_configs.keys()))
+        filter_layout.addWidget(self.filter_combo)
+        
+        self.refresh_btn = QPushButton("Refresh")
+        filter_layout.addWidget(self.refresh_btn)
+
+        # Pagination keeps the table at one page of rows instead of the
+        # entire history
+        self.prev_page_btn = QPushButton("< Prev")
+        filter_layout.addWidget(self.prev_page_btn)
+
+        self.page_label = QLabel("Page 1")
+        filter_layout.addWidget(self.page_label)
+
+        self.next_page_btn = QPushButton("Next >")
+        filter_layout.addWidget(self.next_page_btn)
+
+        filter_layout.addStretch()
+        
+        results_layout.addLayout(filter_layout)
+        
+        # Results table
+        self.results_table = QTableView()
+        results_layout.addWidget(self.results_table)
+        
+        layout.addWidget(results_group)
+        
+        self.tabs.addTab(db_widget, "Database")
+    
+    def setup_analytics_tab(self):
+        analytics_widget = QWidget()
+        layout = QVBoxLayout(analytics_widget)
+        
+        # Filters section
+        filters_group = QGroupBox("Data Filters")
+        filters_layout = QGridLayout(filters_group)
+        
+        # Test type filter
+        filters_layout.addWidget(QLabel("Test Type:"), 0, 0)
+        self.analytics_test_type_combo = QComboBox()
+        self.analytics_test_type_combo.addItems(['All'] + list(self.test_type_configs.keys()))
+        filters_layout.addWidget(self.analytics_test_type_combo, 0, 1)
+        
+        # Pass/Fail filter
+        filters_layout.addWidget(QLabel("Result:"), 0, 2)
+        self.analytics_pass_fail_combo = QComboBox()
+        self.analytics_pass_fail_combo.addItems(['All', 'Pass', 'Fail'])
+        filters_layout.addWidget(self.analytics_pass_fail_combo, 0, 3)
+        
+        # Tester filter
+        filters_layout.addWidget(QLabel("Tester ID:"), 1, 0)
+        self.analytics_tester_edit = QLineEdit()
+        self.analytics_tester_edit.setPlaceholderText("Filter by tester...")
+        filters_layout.addWidget(self.analytics_tester_edit, 1, 1)
+        
+        # Test bench filter
+        filters_layout.addWidget(QLabel("Test Bench:"), 1, 2)
+        self.analytics_bench_edit = QLineEdit()
+        self.analytics_bench_edit.setPlaceholderText("Filter by test bench...")
+        filters_layout.addWidget(self.analytics_bench_edit, 1, 3)
+        
+        # Date filters
+        filters_layout.addWidget(QLabel("Date From:"), 2, 0)
+        self.analytics_date_from = QDateEdit()
+        self.analytics_date_from.setDate(QDate.currentDate().addDays(-30))
+        self.analytics_date_from.setCalendarPopup(True)
+        filters_layout.addWidget(self.analytics_date_from, 2, 1)
+        
+        filters_layout.addWidget(QLabel("Date To:"), 2, 2)
+        self.analytics_date_to = QDateEdit()
+        self.analytics_date_to.setDate(QDate.currentDate())
+        self.analytics_date_to.setCalendarPopup(True)
+        filters_layout.addWidget(self.analytics_date_to, 2, 3)
+        
+        # Filter buttons
+        filter_btn_layout = QHBoxLayout()
+        self.apply_filters_btn = QPushButton("Apply Filters")
+        self.apply_filters_btn.setStyleSheet("QPushButton { background-color: #2196F3; color: white; padding: 8px; }")
+        self.clear_filters_btn = QPushButton("Clear Filters")
+        self.clear_filters_btn.setStyleSheet("QPushButton { background-color: #9E9E9E; color: white; padding: 8px; }")
+        filter_btn_layout.addWidget(self.apply_filters_btn)
+        filter_btn_layout.addWidget(self.clear_filters_btn)
+        filter_btn_layout.addStretch()
+        
+        filters_layout.addLayout(filter_btn_layout, 3, 0, 1, 4)
+        
+        layout.addWidget(filters_group)
+        
+        # Create splitter for analytics content
+        analytics_splitter = QSplitter(Qt.Orientation.Horizontal)
+        layout.addWidget(analytics_splitter)
+        
+        # Left panel - Summary statistics
+        stats_panel = QWidget()
+        stats_layout = QVBoxLayout(stats_panel)
+        
+        # Summary metrics
+        summary_group = QGroupBox("Summary Metrics")
+        summary_layout = QVBoxLayout(summary_group)
+        
+        self.analytics_summary_text = QTextEdit()
+        self.analytics_summary_text.setMaximumHeight(300)
+        self.analytics_summary_text.setReadOnly(True)
+        summary_layout.addWidget(self.analytics_summary_text)
+        
+        stats_layout.addWidget(summary_group)
+        
+        # Detailed breakdown table
+        breakdown_group = QGroupBox("Detailed Breakdown")
+        breakdown_layout = QVBoxLayout(breakdown_group)
+        
+        self.analytics_breakdown_table = QTableView()
+        self.analytics_breakdown_table.setMaximumHeight(250)
+        breakdown_layout.addWidget(self.analytics_breakdown_table)
+        
+        stats_layout.addWidget(breakdown_group)
+        
+        # Right panel - Charts
+        charts_panel = QWidget()
+        charts_layout = QVBoxLayout(charts_panel)
+        charts_layout.addWidget(QLabel("Analytics Charts"))
+        
+        self.analytics_chart_widget = None
+        self.analytics_chart_layout = charts_layout
+        
+        analytics_splitter.addWidget(stats_panel)
+        analytics_splitter.addWidget(charts_panel)
+        analytics_splitter.setSizes([400, 800])
+        
+        self.tabs.addTab(analytics_widget, "Analytics")
+        
+    def setup_settings_tab(self):
+        settings_widget = QWidget()
+        layout = QVBoxLayout(settings_widget)
+        
+        # Export settings
+        export_group = QGroupBox("Export Settings")
+        export_layout = QVBoxLayout(export_group)
+        
+        self.export_sql_btn = QPushButton("Export Database Schema")
+        self.include_sample_check = QCheckBox("Include sample row in schema export")
+        self.export_results_btn = QPushButton("Export Results to CSV")
+
+        export_layout.addWidget(self.export_sql_btn)
+        export_layout.addWidget(self.include_sample_check)
+        export_layout.addWidget(self.export_results_btn)
+        
+        layout.addWidget(export_group)
+        layout.addStretch()
+        
+        self.tabs.addTab(settings_widget, "Settings")
+        
+    def setup_connections(self):
+        # File operations
+        self.load_file_btn.clicked.connect(self.load_file)
+        
+        # Analysis
+        self.analyze_btn.clicked.connect(self.analyze_data)
+        self.save_btn.clicked.connect(self.save_analysis)
+        
+        # Settings changes
+        # textActivated only fires on user interaction, so programmatic
+        # combo updates don't re-run the widget show/hide logic
+        self.test_type_combo.textActivated.connect(self.on_test_type_changed)
+        self.trigger_current_spin.valueChanged.connect(self.update_chart)
+        self.zoom_start_spin.valueChanged.connect(self.update_chart)
+        self.zoom_end_spin.valueChanged.connect(self.update_chart)
+        
+        # Database
+        self.test_connection_btn.clicked.connect(self.test_db_connection)
+        self.refresh_btn.clicked.connect(self.refresh_results_first_page)
+        self.prev_page_btn.clicked.connect(self.previous_results_page)
+        self.next_page_btn.clicked.connect(self.next_results_page)
+        
+        # Analytics connections
+        self.apply_filters_btn.clicked.connect(self.update_analytics)
+        self.clear_filters_btn.clicked.connect(self.clear_analytics_filters)
+
+        # Debounced auto-apply so filters take effect without the button
+        self.analytics_tester_edit.textChanged.connect(self.schedule_analytics_update)
+        self.analytics_bench_edit.textChanged.connect(self.schedule_analytics_update)
+        self.analytics_test_type_combo.currentTextChanged.connect(self.schedule_analytics_update)
+        self.analytics_pass_fail_combo.currentTextChanged.connect(self.schedule_analytics_update)
+        self.analytics_date_from.dateChanged.connect(self.schedule_analytics_update)
+        self.analytics_date_to.dateChanged.connect(self.schedule_analytics_update)
+        
+        # Tabs
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+
+        # Export
+        self.export_sql_btn.clicked.connect(self.export_schema)
+        self.export_results_btn.clicked.connect(self.export_results)
+        
+    def load_file(self):
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Load Oscilloscope CSV Files",
+            "",
+            "CSV Files (*.csv);;All Files (*)"
+        )
+
+        if file_paths:
+            self.loaded_files = file_paths
+            self.current_file_path = file_paths[0]
+            if len(file_paths) == 1:
+                self.file_label.setText(f"Loaded: {os.path.basename(file_paths[0])}")
+            else:
+                self.file_label.setText(f"Loaded: {len(file_paths)} files")
+            self.analyze_btn.setEnabled(True)
+
+    def analyze_data(self):
+        if not self.loaded_files and not getattr(self, 'current_file_path', None):
+            QMessageBox.warning(self, "Warning", "Please load a CSV file first.")
+            return
+
+        # Show progress bar
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setValue(0)
+
+        if len(self.loaded_files) > 1:
+            # Fan the batch out across one process per core
+            self.batch_worker = BatchAnalysisWorker(
+                self.loaded_files,
+                self.trigger_current_spin.value()
+            )
+            self.batch_worker.progress.connect(self.progress_bar.setValue)
+            self.batch_worker.finished.connect(self.on_batch_analysis_finished)
+            self.batch_worker.start()
+            return
+
+        # Start analysis in separate thread
+        self.analysis_worker = AnalysisWorker(
+            self.current_file_path,
+            self.trigger_current_spin.value()
+        )
+        self.analysis_worker.progress.connect(self.progress_bar.setValue)
+        self.analysis_worker.finished.connect(self.on_analysis_finished)
+        self.analysis_worker.start()
+
+    def on_batch_analysis_finished(self, analyses):
+        self.progress_bar.setVisible(False)
+
+        analyzed = [path for path in self.loaded_files if analyses.get(path)]
+        failed = [path for path in self.loaded_files if not analyses.get(path)]
+
+        if not analyzed:
+            QMessageBox.critical(self, "Error", "Failed to analyze the selected files.")
+            return
+
+        # Show the last successfully analyzed capture; Save applies to it
+        self.current_file_path = analyzed[-1]
+        self.current_analysis = analyses[self.current_file_path]
+        self.file_label.setText(
+            f"Loaded: {os.path.basename(self.current_file_path)} "
+            f"({len(analyzed)} of {len(self.loaded_files)} analyzed)"
+        )
+        self.update_results_display()
+        self._do_update_chart()
+        self.save_btn.setEnabled(True)
+
+        if failed:
+            failed_names = "\n".join(os.path.basename(path) for path in failed)
+            QMessageBox.warning(self, "Warning", f"Failed to analyze:\n{failed_names}")
+        
+    def on_analysis_finished(self, analysis_data):
+        self.progress_bar.setVisible(False)
+        self.current_analysis = analysis_data
+        
+        if not analysis_data:
+            QMessageBox.critical(self, "Error", "Failed to analyze data.")
+            return
+            
+        # Update results display
+        self.update_results_display()
+        self._do_update_chart()  # fresh analysis draws immediately, no debounce
+        self.save_btn.setEnabled(True)
+        
+    def update_results_display(self):
+        if not self.current_analysis:
+            return
+            
+        # Extract analysis data
+        ch1 = self.current_analysis.get('ch1', {})
+        ch2 = self.current_analysis.get('ch2', {})
+        trigger = self.current_analysis.get('trigger', {})
+        metadata = self.current_analysis.get('metadata', {})
+        
+        # Format results text line by line with each value fetched once
+        ringdown = ch1.get('ringdown') or {}
+        ringdown_voltage = ringdown.get('ringdown_voltage', 0)
+
+        lines = [
+            "CHANNEL 1 (Voltage):",
+            f"  Peak-to-Peak: {ch1.get('peak_to_peak', 0):.3f} mV",
+            f"  Min/Max: {ch1.get('min', 0):.3f} / {ch1.get('max', 0):.3f} V",
+            f"  RMS: {ch1.get('rms', 0):.3f} V",
+            f"  Noise: {ch1.get('noise', 0):.3f} mV",
+            f"  Ringdown: {ringdown_voltage:.3f} mV",
+            "",
+            "CHANNEL 2 (Current):",
+            f"  Peak-to-Peak: {ch2.get('peak_to_peak', 0):.3f} A",
+            f"  Min/Max: {ch2.get('min', 0):.3f} / {ch2.get('max', 0):.3f} A",
+            f"  RMS: {ch2.get('rms', 0):.3f} A",
+            "",
+            "TRIGGER ANALYSIS:",
+            f"  Threshold: {trigger.get('threshold', 0):.1f} A",
+            f"  Events: {trigger.get('count', 0)}",
+            "",
+            "METADATA:",
+            f"  Data Points: {metadata.get('data_points', 0)}",
+            f"  Sample Rate: {metadata.get('sample_rate', 0):.1f} Hz",
+            f"  Duration: {metadata.get('duration', 0):.3f} ms"
+        ]
+
+        self.results_text.setText("\n".join(lines))
+        
+        # Evaluate pass/fail
+        pass_fail_result = self.evaluate_pass_fail()
+        
+        if pass_fail_result['overall'] == 'pass':
+            self.pass_fail_label.setText("Status: PASS ✓")
+            self.pass_fail_label.setStyleSheet(
+                "QLabel { background-color: #4CAF50; color: white; font-size: 16px; font-weight: bold; padding: 8px; }"
+            )
+        else:
+            self.pass_fail_label.setText("Status: FAIL ✗")
+            self.pass_fail_label.setStyleSheet(
+                "QLabel { background-color: #F44336; color: white; font-size: 16px; font-weight: bold; padding: 8px; }"
+            )
+            
+    def evaluate_pass_fail(self):
+        if not self.current_analysis:
+            return {'overall': 'unknown', 'details': {}}
+
+        ch1 = self.current_analysis.get('ch1', {})
+        config = self.test_type_configs[self.test_type_combo.currentText()]
+        has_ringdown = config.get('has_ringdown', False)
+
+        # Get criteria values
+        peak_lsl = self.peak_lsl_spin.value()
+        peak_usl = self.peak_usl_spin.value()
+        trigger_lsl = self.trigger_lsl_spin.value()
+        trigger_usl = self.trigger_usl_spin.value()
+        noise_lsl = self.noise_lsl_spin.value()
+        noise_usl = self.noise_usl_spin.value()
+        trigger_current = self.trigger_current_spin.value()
+        ringdown_lsl = self.ringdown_lsl_spin.value()
+        ringdown_usl = self.ringdown_usl_spin.value()
+
+        # The criteria are all in the key and the analysis dict itself is
+        # held (an id() would be reusable after the old dict is freed), so
+        # any spinbox or analysis change recomputes and everything else
+        # reuses the last evaluation
+        key = (has_ringdown,
+               peak_lsl, peak_usl, trigger_lsl, trigger_usl,
+               noise_lsl, noise_usl, trigger_current,
+               ringdown_lsl, ringdown_usl)
+        if self.current_analysis is self._pass_fail_analysis and key == self._pass_fail_key:
+            return self._pass_fail_result
+
+        # Evaluate criteria
+        results = {
+            'peak_to_peak': peak_lsl <= ch1.get('peak_to_peak', 0) <= peak_usl,
+            'trigger_current': trigger_lsl <= trigger_current <= trigger_usl,
+            'noise': noise_lsl <= ch1.get('noise', 0) <= noise_usl
+        }
+
+        # Add ringdown check for DC02
+        if has_ringdown:
+            ringdown = ch1.get('ringdown') or {}
+            results['ringdown'] = ringdown_lsl <= ringdown.get('ringdown_voltage', 0) <= ringdown_usl
+        else:
+            results['ringdown'] = True
+
+        overall = 'pass' if all(results.values()) else 'fail'
+
+        self._pass_fail_analysis = self.current_analysis
+        self._pass_fail_key = key
+        self._pass_fail_result = {'overall': overall, 'details': results}
+        return self._pass_fail_result
+        
+    def update_chart(self):
+        # Debounced: restarting the timer swallows redraws while the user
+        # is still scrubbing a spinbox
+        self.chart_timer.start()
+
+    def ensure_chart_widget(self):
+        if self.chart_widget is None:
+            # pyqtgraph redraws interactive zooms far faster than Agg; fall
+            # back to matplotlib when it isn't installed
+            self.chart_widget = PyQtGraphWidget() if pg is not None else MatplotlibWidget()
+            self.chart_layout.addWidget(self.chart_widget)
+        return self.chart_widget
+
+    def ensure_analytics_chart_widget(self):
+        if self.analytics_chart_widget is None:
+            self.analytics_chart_widget = MatplotlibWidget()
+            self.analytics_chart_layout.addWidget(self.analytics_chart_widget)
+        return self.analytics_chart_widget
+
+    def on_tab_changed(self, index):
+        if index == 2:  # Analytics
+            self.ensure_analytics_chart_widget()
+
+    def _do_update_chart(self):
+        if self.current_analysis:
+            zoom_range = (self.zoom_start_spin.value(), self.zoom_end_spin.value())
+            self.ensure_chart_widget().plot_data(
+                self.current_analysis, 
+                self.trigger_current_spin.value(), 
+                zoom_range
+            )
+            
+    def on_test_type_changed(self, test_type):
+        config = self.test_type_configs[test_type]
+
+        # Show/hide skid plate diameter for IDOD
+        is_idod = config.get('has_skid_plate', False)
+        self.skid_plate_combo.setVisible(is_idod)
+        self.skid_plate_label.setVisible(is_idod)
+
+        # Show/hide ringdown criteria for DC02
+        has_ringdown = config.get('has_ringdown', False)
+        # Note: You might need to implement showing/hiding the ringdown row
+        
+    def save_analysis(self):
+        if not self.current_analysis:
+            QMessageBox.warning(self, "Warning", "No analysis data to save.")
+            return
+            
+        # Validate required fields
+        required_fields = [
+            (self.test_number_edit, "Test Number"),
+            (self.test_bench_edit, "Test Bench"),
+            (self.tester_id_edit, "Tester ID")
+        ]
+        
+        missing_fields = []
+        for field, name in required_fields:
+            if not field.text().strip():
+                missing_fields.append(name)
+                
+        if missing_fields:
+            QMessageBox.warning(
+                self, 
+                "Missing Fields", 
+                f"Please fill in the following required fields:\n{', '.join(missing_fields)}"
+            )
+            return
+            
+        # Prepare data for database
+        test_type = self.test_type_combo.currentText()
+        config = self.test_type_configs[test_type]
+        ch1 = self.current_analysis.get('ch1', {})
+        ch2 = self.current_analysis.get('ch2', {})
+        trigger = self.current_analysis.get('trigger', {})
+        metadata = self.current_analysis.get('metadata', {})
+        pass_fail_result = self.evaluate_pass_fail()
+        
+        data = {
+            'file_name': os.path.basename(self.current_file_path),
+            'test_number': self.test_number_edit.text(),
+            'test_bench': self.test_bench_edit.text(),
+            'tester_id': self.tester_id_edit.text(),
+            'test_date': datetime.now().date(),
+            'analysis_date': datetime.now(),
+            'dut_device': config['dut_label'],
+            'reference_device': config['reference_label'],
+            'test_function': self.test_function_combo.currentText(),
+            'peak_to_peak_mv': ch1.get('peak_to_peak', 0),
+            'trigger_current_a': self.trigger_current_spin.value(),
+            'noise_mv': ch1.get('noise', 0),
+            'frequency_khz': metadata.get('sample_rate', 0) / 1000,
+            'data_points': metadata.get('data_points', 0),
+            'sample_rate_khz': metadata.get('sample_rate', 0) / 1000,
+            'peak_to_peak_lsl': self.peak_lsl_spin.value(),
+            'peak_to_peak_usl': self.peak_usl_spin.value(),
+            'trigger_current_lsl': self.trigger_lsl_spin.value(),
+            'trigger_current_usl': self.trigger_usl_spin.value(),
+            'noise_lsl': self.noise_lsl_spin.value(),
+            'noise_usl': self.noise_usl_spin.value(),
+            'trigger_events': trigger.get('count', 0),
+            'pass_fail': pass_fail_result['overall']
+        }
+        
+        # Add optional fields
+        if config.get('has_ringdown', False):
+            ringdown = ch1.get('ringdown') or {}
+            data['ringdown_voltage_mv'] = ringdown.get('ringdown_voltage', 0)
+            data['ringdown_lsl'] = self.ringdown_lsl_spin.value()
+            data['ringdown_usl'] = self.ringdown_usl_spin.value()
+
+        if config.get('has_skid_plate', False):
+            data['skid_plate_diameter'] = self.skid_plate_combo.currentText()
+            
+        # Save to database
+        if self.db_manager.save_analysis(test_type, data):
+            QMessageBox.information(
+                self, 
+                "Success", 
+                f"Analysis saved successfully!\nResult: {pass_fail_result['overall'].upper()}"
+            )
+            self.refresh_results()
+            # Only update analytics if analytics widgets exist
+            try:
+                self.update_analytics()
+            except AttributeError:
+                pass  # Analytics tab not initialized yet
+        else:
+            QMessageBox.critical(self, "Error", "Failed to save analysis to database.")
+            
+    def test_db_connection(self):
+        # Update connection parameters
+        self.db_manager.connection_params.update({
+            'host': self.db_host_edit.text(),
+            'port': self.db_port_edit.text(),
+            'database': self.db_name_edit.text(),
+            'user': self.db_user_edit.text(),
+            'password': self.db_password_edit.text()
+        })
+        self.db_manager.close_pool()
+
+        conn = self.db_manager.connect()
+        if conn:
+            conn.close()
+            QMessageBox.information(self, "Success", "Database connection successful!")
+        else:
+            QMessageBox.critical(self, "Error", "Failed to connect to database.")
+            
+    def refresh_results_first_page(self):
+        self.results_page_offset = 0
+        self.refresh_results()
+
+    def previous_results_page(self):
+        if self.results_page_offset >= self.RESULTS_PAGE_SIZE:
+            self.results_page_offset -= self.RESULTS_PAGE_SIZE
+            self.refresh_results()
+
+    def next_results_page(self):
+        self.results_page_offset += self.RESULTS_PAGE_SIZE
+        self.refresh_results()
+
+    def refresh_results(self):
+        test_type = self.filter_combo.currentText()
+        offset = self.results_page_offset
+        if test_type == 'All':
+            results = self.db_manager.get_all_results(limit=self.RESULTS_PAGE_SIZE, offset=offset)
+            # The merged tables differ in columns, so align every row to the
+            # first row's header set
+            headers = list(results[0].keys()) if results else []
+            rows = [tuple(r.get(h, '') for h in headers) for r in results]
+        else:
+            headers, rows = self.db_manager.get_results(test_type, limit=self.RESULTS_PAGE_SIZE, offset=offset)
+
+        if not rows and offset > 0:
+            # Walked past the last page; step back
+            self.results_page_offset = max(0, offset - self.RESULTS_PAGE_SIZE)
+            return
+
+        self.page_label.setText(f"Page {offset // self.RESULTS_PAGE_SIZE + 1}")
+
+        # Update table
+        self._set_table_model(self.results_table, headers, rows)
+
+    def _set_table_model(self, table, headers, rows):
+        """Swap in a fresh model without intermediate repaints"""
+        table.setUpdatesEnabled(False)
+        try:
+            table.setModel(ResultsTableModel(headers, rows))
+            if rows:
+                table.resizeColumnsToContents()
+        finally:
+            table.setUpdatesEnabled(True)
+    
+    def schedule_analytics_update(self):
+        self.analytics_timer.start()
+
+    def update_analytics(self):
+        """Update analytics tab with current filters"""
+        try:
+            filters = self.get_analytics_filters()
+            summary_data = self.db_manager.get_analytics_summary(filters)
+            
+            if not summary_data:
+                self.analytics_summary_text.setText("No data available with current filters.")
+                self._set_table_model(self.analytics_breakdown_table, [], [])
+                self.ensure_analytics_chart_widget().plot_analytics_charts({})
+                return
+            
+            # Update summary text
+            summary = summary_data.get('summary', {})
+            test_types = summary_data.get('test_types', {})
+            testers = summary_data.get('testers', {})
+            test_benches = summary_data.get('test_benches', {})
+            parameters = summary_data.get('parameters', {})
+            
+            summary_lines = [
+                "OVERALL SUMMARY:",
+                f"  Total Tests: {summary.get('total_tests', 0)}",
+                f"  Pass Count: {summary.get('pass_count', 0)}",
+                f"  Fail Count: {summary.get('fail_count', 0)}",
+                f"  Overall Pass Rate: {summary.get('pass_rate', 0):.1f}%",
+                f"  Recent Pass Rate (30 days): {summary.get('recent_pass_rate', 0):.1f}%",
+                f"  Recent Tests: {summary.get('recent_tests', 0)}",
+                "",
+                "PARAMETER STATISTICS:"
+            ]
+
+            # One lookup per parameter dict instead of one per line
+            for label, key in (("Peak-to-Peak (mV)", 'peak_to_peak'),
+                               ("Trigger Current (A)", 'trigger_current'),
+                               ("Noise (mV)", 'noise')):
+                stats = parameters.get(key, {})
+                summary_lines += [
+                    f"  {label}:",
+                    f"    Mean: {stats.get('mean', 0):.2f}",
+                    f"    Std Dev: {stats.get('std', 0):.2f}",
+                    f"    Range: {stats.get('min', 0):.2f} - {stats.get('max', 0):.2f}",
+                    ""
+                ]
+
+            self.analytics_summary_text.setText("\n".join(summary_lines).rstrip())
+            
+            # Update breakdown table: one comprehension over the three
+            # category dicts instead of three copies of the same loop
+            groups = (('Test Type', test_types), ('Tester', testers), ('Test Bench', test_benches))
+            breakdown_headers = ['Category', 'Name', 'Total Tests', 'Pass', 'Fail', 'Pass Rate (%)']
+            breakdown_rows = [
+                (category, name, stats['total'], stats['pass'], stats['fail'],
+                 f"{(stats['pass'] * 100 / stats['total']) if stats['total'] else 0:.1f}")
+                for category, source in groups for name, stats in source.items()
+            ]
+
+            self._set_table_model(self.analytics_breakdown_table, breakdown_headers, breakdown_rows)
+            
+            # Update charts
+            self.ensure_analytics_chart_widget().plot_analytics_charts(summary_data)
+            
+        except Exception as e:
+            print(f"Analytics update error: {e}")
+    
+    def get_analytics_filters(self):
+        """Get current analytics filters"""
+        filters = {}
+        
+        if self.analytics_test_type_combo.currentText() != 'All':
+            filters['test_type'] = self.analytics_test_type_combo.currentText()
+        
+        if self.analytics_pass_fail_combo.currentText() != 'All':
+            filters['pass_fail'] = self.analytics_pass_fail_combo.currentText()
+        
+        if self.analytics_tester_edit.text().strip():
+            filters['tester_id'] = self.analytics_tester_edit.text().strip()
+        
+        if self.analytics_bench_edit.text().strip():
+            filters['test_bench'] = self.analytics_bench_edit.text().strip()
+        
+        # QDate.toPyDate is stable across the PyQt6 versions we pin, so the
+        # conversion is straight-line code instead of exception-driven
+        filters['date_from'] = self.analytics_date_from.date().toPyDate()
+        filters['date_to'] = self.analytics_date_to.date().toPyDate()
+
+        return filters
+    
+    def clear_analytics_filters(self):
+        """Clear all analytics filters"""
+        widgets = (self.analytics_test_type_combo, self.analytics_pass_fail_combo,
+                   self.analytics_tester_edit, self.analytics_bench_edit,
+                   self.analytics_date_from, self.analytics_date_to)
+
+        # Block the auto-apply debounce while resetting, then refresh once
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            self.analytics_test_type_combo.setCurrentText('All')
+            self.analytics_pass_fail_combo.setCurrentText('All')
+            self.analytics_tester_edit.clear()
+            self.analytics_bench_edit.clear()
+            self.analytics_date_from.setDate(QDate.currentDate().addDays(-30))
+            self.analytics_date_to.setDate(QDate.currentDate())
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+
+        self.analytics_timer.stop()  # drop any pending debounced refresh
+        self.update_analytics()
+            
+    def export_schema(self):
+        schema_sql = self.generate_database_schema(
+            include_sample_data=self.include_sample_check.isChecked())
+        
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, 
+            "Export Database Schema", 
+            "oscilloscope_schema.sql", 
+            "SQL Files (*.sql);;All Files (*)"
+        )
+        
+        if file_path:
+            with open(file_path, 'w') as f:
+                f.write(schema_sql)
+            QMessageBox.information(self, "Success", f"Schema exported to {file_path}")
+            
+    def export_results(self):
+        """Export filtered results to CSV"""
+        # Get current filters if on analytics tab, otherwise export the
+        # database tab's selection
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        if self.tabs.currentIndex() == 2:  # Analytics tab
+            filters = self.get_analytics_filters()
+            default_filename = f"analytics_export_{timestamp}.csv"
+        else:
+            test_type = self.filter_combo.currentText()
+            filters = {'test_type': test_type} if test_type != 'All' else None
+            default_filename = f"test_results_{timestamp}.csv"
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Results to CSV",
+            default_filename,
+            "CSV Files (*.csv);;All Files (*)"
+        )
+
+        if not file_path:
+            return
+
+        # Stream the rows in a worker so the event loop stays responsive
+        self.export_results_btn.setEnabled(False)
+        self.export_worker = ExportWorker(self.db_manager, file_path, filters)
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.export_worker.error.connect(self.on_export_error)
+        self.export_worker.start()
+
+    def on_export_finished(self, records, file_path):
+        self.export_results_btn.setEnabled(True)
+        if records == 0:
+            QMessageBox.warning(self, "Warning", "No data to export.")
+            return
+
+        QMessageBox.information(
+            self,
+            "Success",
+            f"Results exported successfully!\nFile: {file_path}\nRecords: {records}"
+        )
+
+    def on_export_error(self, message):
+        self.export_results_btn.setEnabled(True)
+        QMessageBox.critical(self, "Export Error", f"Failed to export results:\n{message}")
+        
+    def generate_database_schema(self, include_sample_data=False):
+        if include_sample_data:
+            return _SCHEMA_DDL + "\n\n" + _SAMPLE_DATA_DML
+        return _SCHEMA_DDL
+
+# Dark theme declared as data; the QPalette is assembled once on first use
+# so an eventual light/dark toggle just swaps the role table
+_DARK_PALETTE_COLORS = (
+    (QPalette.ColorRole.Window, (53, 53, 53)),
+    (QPalette.ColorRole.WindowText, (255, 255, 255)),
+    (QPalette.ColorRole.Base, (25, 25, 25)),
+    (QPalette.ColorRole.AlternateBase, (53, 53, 53)),
+    (QPalette.ColorRole.ToolTipBase, (0, 0, 0)),
+    (QPalette.ColorRole.ToolTipText, (255, 255, 255)),
+    (QPalette.ColorRole.Text, (255, 255, 255)),
+    (QPalette.ColorRole.Button, (53, 53, 53)),
+    (QPalette.ColorRole.ButtonText, (255, 255, 255)),
+    (QPalette.ColorRole.BrightText, (255, 0, 0)),
+    (QPalette.ColorRole.Link, (42, 130, 218)),
+    (QPalette.ColorRole.Highlight, (42, 130, 218)),
+    (QPalette.ColorRole.HighlightedText, (0, 0, 0))
+)
+_dark_palette = None
+
+def dark_palette():
+    global _dark_palette
+    if _dark_palette is None:
+        _dark_palette = QPalette()
+        for role, rgb in _DARK_PALETTE_COLORS:
+            _dark_palette.setColor(role, QColor(*rgb))
+    return _dark_palette
+
+def main():
+    app = QApplication(sys.argv)
+
+    # Set application style
+    app.setStyle('Fusion')
+
+    # Set dark theme
+    app.setPalette(dark_palette())
+    
+    # Create and show main window
+    window = OscilloscopeAnalyzer()
+    window.show()
+    
+    sys.exit(app.exec())
+
+if __name__ == '__main__':
     main()
\ No newline at end of file